@@ -0,0 +1,62 @@
+"""Resume token/analysis caches and resumes indexes
+
+Brings databases created before these model changes up to date. Tables are
+created by Base.metadata.create_all at startup, which never alters an existing
+table, so every statement is idempotent (IF [NOT] EXISTS): it is a no-op on a
+database that create_all already built with the current models.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _resumes_table_missing() -> bool:
+    # Fresh database, app not started yet: create_all will build the full table
+    if context.is_offline_mode():
+        return False
+    return not sa.inspect(op.get_bind()).has_table("resumes")
+
+
+def upgrade() -> None:
+    if _resumes_table_missing():
+        return
+
+    # Resume.tokens_cache: sorted keyword tokens, filled at extraction time
+    op.execute("ALTER TABLE resumes ADD COLUMN IF NOT EXISTS tokens_cache JSONB")
+    # Resume.ats_result / role_match_cache: cached analysis, reset on re-extraction
+    op.execute("ALTER TABLE resumes ADD COLUMN IF NOT EXISTS ats_result JSONB")
+    op.execute("ALTER TABLE resumes ADD COLUMN IF NOT EXISTS role_match_cache JSONB")
+
+    # Admin top_resumes ranking: ORDER BY (ats_score + role_match) DESC
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_resumes_combined_score "
+        "ON resumes ((ats_score + role_match) DESC)"
+    )
+    # Per-user history listing: WHERE user_id = ? ORDER BY created_at DESC
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_resumes_user_created "
+        "ON resumes (user_id, created_at DESC)"
+    )
+
+
+def downgrade() -> None:
+    if _resumes_table_missing():
+        return
+
+    op.execute("DROP INDEX IF EXISTS ix_resumes_user_created")
+    op.execute("DROP INDEX IF EXISTS ix_resumes_combined_score")
+    op.execute("ALTER TABLE resumes DROP COLUMN IF EXISTS role_match_cache")
+    op.execute("ALTER TABLE resumes DROP COLUMN IF EXISTS ats_result")
+    op.execute("ALTER TABLE resumes DROP COLUMN IF EXISTS tokens_cache")
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
-from sqlalchemy.sql import func
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
 from ... import models, schemas
@@ -8,20 +8,24 @@ from ..deps import get_db, get_current_admin_user
 
 router = APIRouter()
 
-@router.get("/top_resumes", response_model=List[schemas.resume.Resume])
+@router.get("/top_resumes", response_model=List[schemas.resume.ResumeListItem])
 async def get_top_resumes_endpoint(
     n: int = Query(10, gt=0, le=100),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     admin_user: models.user.User = Depends(get_current_admin_user),
 ):
     """
     Admin-only: Get top N resumes, ranked by a combined score.
     """
-    # Define the combined score (ats_score + role_match)
-    combined_score = (models.resume.Resume.ats_score + models.resume.Resume.role_match).label("combined_score")
-    
-    top_resumes = db.query(models.resume.Resume).order_by(
-        combined_score.desc()
-    ).limit(n).all()
+    # Define the combined score (ats_score + role_match); must match the
+    # ix_resumes_combined_score expression for Postgres to use the index.
+    ResumeModel = models.resume.Resume
+    combined_score = ResumeModel.ats_score + ResumeModel.role_match
+
+    # Only select the columns the list schema exposes (skips the extracted_data JSONB)
+    columns = [getattr(ResumeModel, name) for name in schemas.resume.ResumeListItem.model_fields]
+    top_resumes = (await db.execute(
+        select(*columns).order_by(combined_score.desc()).limit(n)
+    )).mappings().all()
     
     return top_resumes
\ No newline at end of file
@@ -1,5 +1,8 @@
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ... import models, schemas
 from ..deps import get_db, get_current_admin_user
@@ -15,31 +18,46 @@ from ...services.external import (
 
 router = APIRouter()
 
-@router.get("/fetch_profiles", response_model=schemas.user.User)
+@router.get("/fetch_profiles", response_model=schemas.user.ProfileFetch)
 async def fetch_profiles_endpoint(
     user_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     admin_user: models.user.User = Depends(get_current_admin_user),
 ):
     """
     Admin-only: Trigger a fetch of GitHub/LeetCode stats for a specific user.
+    A failed platform keeps its previous snapshot and is reported in fetch_errors.
     """
-    user = db.query(models.user.User).filter(models.user.User.id == user_id).first()
+    user = await db.scalar(select(models.user.User).where(models.user.User.id == user_id))
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
+    # The platform fetches are independent; run them concurrently
+    tasks = []
     if user.github_link:
-        user.github_stats = await github_api.fetch_github_stats(user.github_link)
+        tasks.append(("github_stats", github_api.fetch_github_stats(user.github_link)))
         
     if user.leetcode_link:
         # Store full analytics snapshot; frontend can pick what to visualize
         username = user.leetcode_link.rstrip("/").split("/")[-1]
-        user.leetcode_stats = await leetcode_analytics.get_leetcode_analytics(username)
-
-    db.commit()
-    db.refresh(user)
-    
-    return user
+        tasks.append(("leetcode_stats", leetcode_analytics.get_leetcode_analytics(username)))
+
+    results = await asyncio.gather(*(coro for _, coro in tasks), return_exceptions=True)
+    fetch_errors = {}
+    for (attr_name, _), result in zip(tasks, results):
+        # Keep the previous snapshot if a platform fetch failed
+        if isinstance(result, Exception):
+            print(f"Warning: {attr_name} fetch failed for user {user_id}: {result!r}")
+            fetch_errors[attr_name] = str(result) or type(result).__name__
+        else:
+            setattr(user, attr_name, result)
+
+    await db.commit()
+    await db.refresh(user)
+
+    response = schemas.user.ProfileFetch.model_validate(user)
+    response.fetch_errors = fetch_errors
+    return response
 
 
 @router.get("/github/{username}/analytics")
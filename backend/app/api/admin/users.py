@@ -1,5 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from typing import List
 
 from ... import models, schemas
@@ -7,32 +9,44 @@ from ..deps import get_db, get_current_admin_user
 
 router = APIRouter()
 
-@router.get("/users", response_model=List[schemas.user.User])
+@router.get("/users", response_model=List[schemas.user.UserListItem])
 async def get_all_users_endpoint(
-    db: Session = Depends(get_db),
+    limit: int = Query(100, gt=0, le=1000),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db),
     admin_user: models.user.User = Depends(get_current_admin_user),
 ):
     """
-    Admin-only: Get a list of all users.
+    Admin-only: Get a page of users.
     """
-    users = db.query(models.user.User).all()
+    # Only select the columns the list schema exposes (skips the JSONB stats)
+    UserModel = models.user.User
+    columns = [getattr(UserModel, name) for name in schemas.user.UserListItem.model_fields]
+    users = (await db.execute(
+        select(*columns).order_by(UserModel.id).limit(limit).offset(offset)
+    )).mappings().all()
     return users
 
 @router.get("/user/{user_id}")
 async def get_user_details_endpoint(
     user_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     admin_user: models.user.User = Depends(get_current_admin_user),
 ):
     """
     Admin-only: Get detailed info for one user, including their resumes.
     """
-    user = db.query(models.user.User).filter(models.user.User.id == user_id).first()
+    user = await db.scalar(
+        select(models.user.User)
+        .options(selectinload(models.user.User.resumes))
+        .where(models.user.User.id == user_id)
+    )
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
-    resumes = db.query(models.resume.Resume).filter(
-        models.resume.Resume.user_id == user_id
-    ).all()
-    
-    return {"user_info": user, "resumes": resumes}
\ No newline at end of file
+    # Serialize through the schemas; the raw ORM objects carry session state
+    # that cannot be lazily loaded outside the async session.
+    return {
+        "user_info": schemas.user.User.model_validate(user),
+        "resumes": [schemas.resume.Resume.model_validate(r) for r in user.resumes],
+    }
\ No newline at end of file
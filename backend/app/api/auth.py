@@ -1,36 +1,32 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
 
-from ..database import SessionLocal
 from ..config import settings
 from ..models.user import User as UserModel
 from ..schemas.user import UserCreate, User, Token
 from ..utils.auth import (
     get_password_hash,
-    verify_password,
+    verify_and_update_password,
     create_access_token,
 )
+from ..utils.rate_limit import limiter
 from ..api.deps import get_db
 
 router = APIRouter()
 
 @router.post("/register", response_model=User)
-def register(user: UserCreate, db: Session = Depends(get_db)):
+async def register(user: UserCreate, db: AsyncSession = Depends(get_db)):
     """
     Register a new user
     """
-    # Check if user already exists
-    db_user = db.query(UserModel).filter(UserModel.email == user.email).first()
-    if db_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
-    
-    # Create new user
-    hashed_password = get_password_hash(user.password)
+    # Create new user (hashing is CPU-bound; keep it off the event loop)
+    hashed_password = await asyncio.to_thread(get_password_hash, user.password)
     db_user = UserModel(
         email=user.email,
         name=user.name,
@@ -39,26 +35,46 @@ def register(user: UserCreate, db: Session = Depends(get_db)):
         leetcode_link=user.leetcode_link,
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    # The unique index on email rejects duplicates; no separate lookup needed
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
+    await db.refresh(db_user)
     return db_user
 
 
 @router.post("/token", response_model=Token)
-def login(
+@limiter.limit("10/minute")  # password hashing is deliberately expensive; cap attempts per client
+async def login(
+    request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     OAuth2 compatible token login, get an access token for future requests
     """
-    user = db.query(UserModel).filter(UserModel.email == form_data.username).first()
-    if not user or not verify_password(form_data.password, user.password_hash):
+    user = await db.scalar(select(UserModel).where(UserModel.email == form_data.username))
+    verified, new_hash = (False, None)
+    if user:
+        verified, new_hash = await asyncio.to_thread(
+            verify_and_update_password, form_data.password, user.password_hash
+        )
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
+
+    # Transparently move legacy bcrypt hashes to argon2
+    if new_hash:
+        user.password_hash = new_hash
+        await db.commit()
     
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
@@ -1,44 +1,59 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from jose import JWTError, jwt
 
-from ..database import SessionLocal
+from ..database import AsyncSessionLocal
 from ..config import settings
 from ..models.user import User as UserModel
 from ..schemas.user import TokenData
+from ..utils import jwt_cache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/token") # Assume auth route exists
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
+async def get_current_user(
+    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
 ) -> UserModel:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    key = jwt_cache.token_key(token)
+    if jwt_cache.is_rejected(key):
+        raise credentials_exception
+
+    # Fast path: token already verified recently, only a PK lookup is needed
+    user_id = jwt_cache.get_user_id(key)
+    if user_id is not None:
+        user = await db.get(UserModel, user_id)
+        if user is not None:
+            return user
+
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
         email: str = payload.get("sub")
         if email is None:
+            jwt_cache.remember_rejected(key)
             raise credentials_exception
         token_data = TokenData(email=email)
     except JWTError:
+        jwt_cache.remember_rejected(key)
         raise credentials_exception
     
-    user = db.query(UserModel).filter(UserModel.email == token_data.email).first()
+    user = await db.scalar(select(UserModel).where(UserModel.email == token_data.email))
     if user is None:
+        jwt_cache.remember_rejected(key)
         raise credentials_exception
+
+    jwt_cache.remember_valid(key, user.id, payload.get("exp"))
     return user
 
 # This is a placeholder. Real admin logic should check a role/scope.
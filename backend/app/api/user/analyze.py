@@ -1,5 +1,9 @@
+import asyncio
+import hashlib
+
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ... import models, schemas
 from ..deps import get_db, get_current_user
@@ -7,41 +11,74 @@ from ...services.analysis import ats_scorer, keyword_matcher
 
 router = APIRouter()
 
+# Role-match results kept per resume (most recent job descriptions win). Stored as a
+# list of [jd_key, result] pairs, oldest first: JSONB objects do not preserve key
+# order, so a dict could not tell which entry is oldest after a round trip.
+ROLE_MATCH_CACHE_SIZE = 20
+
 @router.post("/analyze_resume")
 async def analyze_resume_endpoint(
     resume_id: int,
     request: schemas.resume.ResumeAnalysisRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.user.User = Depends(get_current_user),
 ):
     """
     Analyze an extracted resume against a job description.
     """
     # 1. Get the resume
-    resume = db.query(models.resume.Resume).filter(
-        models.resume.Resume.id == resume_id,
-        models.resume.Resume.user_id == current_user.id
-    ).first()
+    resume = await db.scalar(
+        select(models.resume.Resume).where(
+            models.resume.Resume.id == resume_id,
+            models.resume.Resume.user_id == current_user.id
+        )
+    )
 
     if not resume:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found")
     if not resume.extracted_data:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Resume has not been extracted yet")
 
-    # 2. Calculate ATS Score
-    ats_result = ats_scorer.calculate_ats_score(
-        resume.extracted_data, resume.font_stats, resume.bullet_used
-    )
+    # 2. Calculate ATS Score (CPU-bound text scanning, kept off the event loop).
+    # It only depends on the resume, so it is computed once per extraction (and
+    # again whenever the scorer version changes).
+    cached_ats = resume.ats_result
+    if isinstance(cached_ats, dict) and cached_ats.get("version") == ats_scorer.SCORER_VERSION:
+        ats_result = cached_ats["result"]
+    else:
+        ats_result = await asyncio.to_thread(
+            ats_scorer.calculate_ats_score,
+            resume.extracted_data, resume.font_stats, resume.bullet_used
+        )
+        resume.ats_result = {"version": ats_scorer.SCORER_VERSION, "result": ats_result}
     
-    # 3. Calculate Role Match
-    role_match_result = keyword_matcher.calculate_role_match(
-        resume.extracted_data, request.job_description
+    # 3. Calculate Role Match (cached per job description and matcher version)
+    jd_digest = hashlib.blake2b(request.job_description.encode(), digest_size=8).hexdigest()
+    jd_key = f"v{keyword_matcher.MATCHER_VERSION}:{jd_digest}"
+    role_match_cache = resume.role_match_cache
+    if not isinstance(role_match_cache, list):
+        role_match_cache = []
+    role_match_result = next(
+        (result for key, result in role_match_cache if key == jd_key), None
     )
+    if role_match_result is None:
+        # Stored tokens are only reusable if the same tokenizer produced them
+        tokens_cache = resume.tokens_cache
+        resume_tokens = None
+        if isinstance(tokens_cache, dict) and tokens_cache.get("version") == keyword_matcher.MATCHER_VERSION:
+            resume_tokens = tokens_cache["tokens"]
+        role_match_result = await asyncio.to_thread(
+            keyword_matcher.calculate_role_match,
+            resume.extracted_data, request.job_description, resume_tokens
+        )
+        # Assign a new list so the JSONB change is detected; drop the oldest entries
+        entries = role_match_cache[-(ROLE_MATCH_CACHE_SIZE - 1):]
+        resume.role_match_cache = entries + [[jd_key, role_match_result]]
 
     # 4. Save scores to DB
     resume.ats_score = ats_result["score"]
     resume.role_match = role_match_result["percentage"]
-    db.commit()
+    await db.commit()
     
     return {
         "ats_compliance_score": ats_result["score"],
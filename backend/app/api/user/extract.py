@@ -1,26 +1,33 @@
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ... import models, schemas
 from ..deps import get_db, get_current_user
 from ...services.extraction import pdf_extractor, docx_extractor, image_extractor, layout_detector
+from ...services.extraction import pool as extraction_pool
+from ...services.analysis import keyword_matcher
 
 router = APIRouter()
 
 @router.post("/extract_resume", response_model=schemas.resume.Resume)
 async def extract_resume_endpoint(
     resume_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.user.User = Depends(get_current_user),
 ):
     """
     Trigger the extraction pipeline for a previously uploaded resume.
     """
     # 1. Get the resume from DB
-    resume = db.query(models.resume.Resume).filter(
-        models.resume.Resume.id == resume_id,
-        models.resume.Resume.user_id == current_user.id
-    ).first()
+    resume = await db.scalar(
+        select(models.resume.Resume).where(
+            models.resume.Resume.id == resume_id,
+            models.resume.Resume.user_id == current_user.id
+        )
+    )
 
     if not resume:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found")
@@ -28,19 +35,22 @@ async def extract_resume_endpoint(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot extract from generated resume")
 
     # 2. Route to correct extractor
+    # PDF/DOCX parsing is synchronous, CPU-bound and can take seconds; run it in
+    # the extraction process pool so the event loop keeps serving other requests
+    # and concurrent extractions use separate cores.
     blocks = []
     if resume.file_type == "application/pdf":
-        # This now uses your advanced pdf_extractor
-        blocks = pdf_extractor.extract(resume.file_path)
+        # This now uses your advanced pdf_extractor (PyMuPDF, pdfminer fallback)
+        blocks = await pdf_extractor.extract(resume.file_path)
     elif resume.file_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-        blocks = docx_extractor.extract(resume.file_path)
+        blocks = await extraction_pool.run(docx_extractor.extract, resume.file_path)
     elif resume.file_type in ["image/jpeg", "image/png"]:
         blocks = await image_extractor.extract(resume.file_path)
     else:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Unsupported file type for extraction")
 
     # 3. Detect layout
-    layout_data = layout_detector.detect_layout(blocks)
+    layout_data = await asyncio.to_thread(layout_detector.detect_layout, blocks)
     
     # 4. Parse sections based on layout
     # This is complex. You'll build a parser here.
@@ -48,11 +58,17 @@ async def extract_resume_endpoint(
     font_stats = {"fonts": ["Arial"], "sizes": [10, 12]} # You'll get this from the blocks
     bullet_used = True
 
+    # Tokenize once here; every later role-match reuses the stored tokens
+    tokens = await asyncio.to_thread(keyword_matcher.tokenize_resume, extracted_data)
+
     # 5. Save results to DB
     resume.extracted_data = extracted_data
+    resume.tokens_cache = {"version": keyword_matcher.MATCHER_VERSION, "tokens": sorted(tokens)}
+    resume.ats_result = None
+    resume.role_match_cache = None
     resume.font_stats = font_stats
     resume.bullet_used = bullet_used
-    db.commit()
-    db.refresh(resume)
+    await db.commit()
+    await db.refresh(resume)
     
     return resume
\ No newline at end of file
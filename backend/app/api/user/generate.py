@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ... import models, schemas
 from ..deps import get_db, get_current_user
@@ -10,7 +10,7 @@ router = APIRouter()
 @router.post("/generate_resume", response_model=schemas.resume.Resume)
 async def generate_resume_endpoint(
     request: schemas.resume.ResumeGenerationRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.user.User = Depends(get_current_user),
 ):
     """
@@ -27,7 +27,7 @@ async def generate_resume_endpoint(
         # You might also want to save the raw 'resume_text' somewhere
     )
     db.add(new_resume)
-    db.commit()
-    db.refresh(new_resume)
+    await db.commit()
+    await db.refresh(new_resume)
     
     return new_resume
\ No newline at end of file
@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
 from ... import models, schemas
@@ -7,16 +8,23 @@ from ..deps import get_db, get_current_user
 
 router = APIRouter()
 
-@router.get("/get_user_resumes", response_model=List[schemas.resume.Resume])
+@router.get("/get_user_resumes", response_model=List[schemas.resume.ResumeListItem])
 async def get_user_resumes_endpoint(
-    db: Session = Depends(get_db),
+    limit: int = Query(50, gt=0, le=200),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db),
     current_user: models.user.User = Depends(get_current_user),
 ):
     """
-    Get all resumes for the currently authenticated user.
+    Get resumes for the currently authenticated user, newest first.
     """
-    resumes = db.query(models.resume.Resume).filter(
-        models.resume.Resume.user_id == current_user.id
-    ).order_by(models.resume.Resume.created_at.desc()).all()
+    # Only select the columns the list schema exposes (skips the extracted_data JSONB)
+    ResumeModel = models.resume.Resume
+    columns = [getattr(ResumeModel, name) for name in schemas.resume.ResumeListItem.model_fields]
+    resumes = (await db.execute(
+        select(*columns).where(
+            ResumeModel.user_id == current_user.id
+        ).order_by(ResumeModel.created_at.desc()).limit(limit).offset(offset)
+    )).mappings().all()
     
     return resumes
\ No newline at end of file
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
 from ... import models
@@ -12,17 +13,19 @@ router = APIRouter()
 @router.post("/improve_resume", response_model=List[Improvement])
 async def improve_resume_endpoint(
     resume_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.user.User = Depends(get_current_user),
 ):
     """
     Generate LLM-assisted improvements for an extracted resume.
     """
     # 1. Get resume
-    resume = db.query(models.resume.Resume).filter(
-        models.resume.Resume.id == resume_id,
-        models.resume.Resume.user_id == current_user.id
-    ).first()
+    resume = await db.scalar(
+        select(models.resume.Resume).where(
+            models.resume.Resume.id == resume_id,
+            models.resume.Resume.user_id == current_user.id
+        )
+    )
 
     if not resume or not resume.extracted_data:
         raise HTTPException(status_code=404, detail="Extracted resume not found")
@@ -30,18 +33,25 @@ async def improve_resume_endpoint(
     # 2. Call LLM improver service
     suggestions = await improver.get_section_suggestions(resume.extracted_data)
     
+    if not suggestions:
+        return []
+
     # 3. Save suggestions to DB
-    db_improvements = []
-    for s in suggestions:
-        imp = models.improvement.Improvement(
-            resume_id=resume_id,
-            section=s["section"],
-            suggestion=s["suggestion"],
-            old_text=s["old_text"]
-        )
-        db_improvements.append(imp)
-    
-    db.add_all(db_improvements)
-    db.commit()
+    # One multi-row INSERT ... RETURNING instead of a per-row INSERT from the
+    # unit-of-work flush; the returned rows already carry id and created_at.
+    rows = [
+        {
+            "resume_id": resume_id,
+            "section": s["section"],
+            "suggestion": s["suggestion"],
+            "old_text": s["old_text"],
+        }
+        for s in suggestions
+    ]
+    db_improvements = (await db.scalars(
+        insert(models.improvement.Improvement).returning(models.improvement.Improvement),
+        rows,
+    )).all()
+    await db.commit()
     
     return db_improvements
\ No newline at end of file
@@ -1,5 +1,10 @@
+import asyncio
+from typing import Optional
+
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ... import models, schemas
 from ..deps import get_db
@@ -8,10 +13,42 @@ from ...utils import file_handler
 
 router = APIRouter()
 
+# Guest user id, resolved once per process (the guest row never changes once created)
+_GUEST_ID: Optional[int] = None
+
+
+async def _get_or_create_guest(db: AsyncSession) -> int:
+    """
+    Return the guest user's id, creating the guest on first use.
+    Only the integer id is cached; ORM instances are bound to their session.
+    """
+    global _GUEST_ID
+    if _GUEST_ID is not None:
+        return _GUEST_ID
+
+    UserModel = models.user.User
+    guest_id = await db.scalar(select(UserModel.id).where(UserModel.email == "guest@local"))
+    if guest_id is None:
+        # Atomic upsert: concurrent first uploads cannot both insert the guest
+        # (the loser's INSERT is a no-op instead of a unique-violation 500).
+        password_hash = await asyncio.to_thread(get_password_hash, "guest")
+        guest_id = await db.scalar(
+            pg_insert(UserModel)
+            .values(email="guest@local", name="Guest", password_hash=password_hash)
+            .on_conflict_do_nothing(index_elements=["email"])
+            .returning(UserModel.id)
+        )
+        await db.commit()
+        if guest_id is None:
+            guest_id = await db.scalar(select(UserModel.id).where(UserModel.email == "guest@local"))
+
+    _GUEST_ID = guest_id
+    return guest_id
+
 @router.post("/upload_resume")
 async def upload_resume_endpoint(
     file: UploadFile = File(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Upload a resume file (.pdf, .docx, .png, .jpg), save it,
@@ -31,28 +68,19 @@ async def upload_resume_endpoint(
         )
 
     # 2. Resolve user (temporary auth bypass: use or create a guest user)
-    guest = db.query(models.user.User).filter(models.user.User.email == "guest@local").first()
-    if not guest:
-        guest = models.user.User(
-            email="guest@local",
-            name="Guest",
-            password_hash=get_password_hash("guest")
-        )
-        db.add(guest)
-        db.commit()
-        db.refresh(guest)
+    guest_id = await _get_or_create_guest(db)
 
     # 3. Save the file (e.g., to S3 or local storage)
-    file_path = await file_handler.save_upload_file(file, guest.id)
+    file_path = await file_handler.save_upload_file(file, guest_id)
     
     # 4. Create resume record in DB
     new_resume = models.resume.Resume(
-        user_id=guest.id,
+        user_id=guest_id,
         file_path=str(file_path),
         file_type=file.content_type
     )
     db.add(new_resume)
-    db.commit()
-    db.refresh(new_resume)
+    await db.commit()
+    await db.refresh(new_resume)
     
     return {"resume_id": new_resume.id, "file_path": file_path}
\ No newline at end of file
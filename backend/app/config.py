@@ -6,6 +6,11 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    EXTRACTION_WORKERS: int = 4  # PDF/DOCX parsing processes (capped at the CPU count)
+    EXTRACTION_CACHE_DIR: Optional[str] = None  # defaults to backend/extraction_cache
     DEEPSEEK_API_KEY: Optional[str] = None  # Optional, only needed for image OCR extraction
     GITHUB_TOKEN: Optional[str] = None
     HF_TOKEN: Optional[str] = None
@@ -1,8 +1,33 @@
-from sqlalchemy import create_engine
+from functools import lru_cache
+
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 from .config import settings
 
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
\ No newline at end of file
+
+def _async_database_url(database_url: str) -> URL:
+    """
+    DATABASE_URL is configured as a plain postgresql:// URL; route it through asyncpg.
+    """
+    return make_url(database_url).set(drivername="postgresql+asyncpg")
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> AsyncEngine:
+    # Created once per process so the connection pool is shared by all requests.
+    # The default pool (5 + 10 overflow) throttles concurrent async requests;
+    # LIFO reuse keeps recently used connections warm and lets idle ones expire.
+    return create_async_engine(
+        _async_database_url(settings.DATABASE_URL),
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_use_lifo=True,
+    )
+
+
+engine = get_engine()
+AsyncSessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+Base = declarative_base()
@@ -1,19 +1,40 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from slowapi import _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
 from .database import engine, Base
 from .api.user import generate, upload, extract, analyze, improve, history
 from .api.admin import profiles, users, analytics
 from .api.auth import router as auth_router
+from .utils.rate_limit import limiter
+from .services.extraction import pool as extraction_pool
+from .services.external import http_client
 
-# This creates the tables. For production, use Alembic migrations.
-Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # This creates the tables. For production, use Alembic migrations.
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield
+    await extraction_pool.shutdown()
+    await http_client.aclose()
+    await engine.dispose()
 
 app = FastAPI(
     title="AI Resume Intelligence Platform",
     description="API for managing, analyzing, and improving resumes.",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+# Rate limiting (see utils/rate_limit.py)
+app.state.limiter = limiter
+app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
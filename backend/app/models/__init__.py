@@ -0,0 +1,4 @@
+# Import every model so the declarative registry and Base.metadata are complete as
+# soon as any one of them is imported: relationships refer to each other by name
+# ("Resume"), and create_all only creates tables it has seen.
+from . import user, resume, improvement  # noqa: F401
@@ -13,4 +13,8 @@ class Improvement(Base):
     new_text = Column(Text, nullable=True)
     suggestion = Column(Text, nullable=False)
     
-    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=text('now()'))
\ No newline at end of file
+    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=text('now()'))
+
+    # Return server-generated columns (created_at) from the INSERT itself;
+    # async sessions cannot lazy-load them afterwards.
+    __mapper_args__ = {"eager_defaults": True}
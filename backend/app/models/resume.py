@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, TIMESTAMP
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, TIMESTAMP, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql.expression import text
 from ..database import Base
@@ -17,5 +17,25 @@ class Resume(Base):
     role_match = Column(Integer, default=0)
     font_stats = Column(JSONB, nullable=True)
     bullet_used = Column(Boolean, default=False)
+    # Sorted keyword tokens of extracted_data, computed at extraction time so
+    # role matching is a set intersection with the job description:
+    # {"version": keyword_matcher.MATCHER_VERSION, "tokens": [...]}.
+    tokens_cache = Column(JSONB, nullable=True)
+    # Cached analysis output, cleared whenever the resume is re-extracted:
+    # ats_result ({"version": ats_scorer.SCORER_VERSION, "result": ...}) depends only
+    # on the resume; role_match_cache is a list of ["v<MATCHER_VERSION>:<JD digest>",
+    # result] pairs, oldest first. A version mismatch is treated as a miss.
+    ats_result = Column(JSONB, nullable=True)
+    role_match_cache = Column(JSONB, nullable=True)
     
-    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=text('now()'))
\ No newline at end of file
+    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=text('now()'))
+
+    __table_args__ = (
+        # Expression index backing the admin top_resumes ranking, so
+        # ORDER BY (ats_score + role_match) DESC LIMIT n is an index scan. self_group()
+        # parenthesises the expression, which Postgres requires in an index definition.
+        Index("ix_resumes_combined_score", (ats_score + role_match).self_group().desc()),
+        # Serves the per-user history listing (WHERE user_id = ? ORDER BY created_at DESC)
+        # without a sort step; also covers plain user_id lookups and FK cascades.
+        Index("ix_resumes_user_created", user_id, created_at.desc()),
+    )
@@ -1,5 +1,6 @@
 from sqlalchemy import Column, Integer, String
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship
 from ..database import Base
 
 class User(Base):
@@ -14,4 +15,6 @@ class User(Base):
     leetcode_link = Column(String(255), nullable=True)
     
     github_stats = Column(JSONB, nullable=True)
-    leetcode_stats = Column(JSONB, nullable=True)
\ No newline at end of file
+    leetcode_stats = Column(JSONB, nullable=True)
+
+    resumes = relationship("Resume", backref="user")
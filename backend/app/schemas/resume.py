@@ -22,14 +22,19 @@ class ResumeGenerationRequest(BaseModel):
 class ResumeAnalysisRequest(BaseModel):
     job_description: str
 
-# Base response model
-class Resume(BaseModel):
+# Summary row for list views; leaves out the (potentially large) extracted_data
+class ResumeListItem(BaseModel):
     id: int
     user_id: int
     file_type: str
     ats_score: int
     role_match: int
     created_at: datetime
-    extracted_data: Optional[Dict[str, Any]] = None
-    
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+
+    model_config = ConfigDict(from_attributes=True)
+
+# Base response model
+class Resume(ResumeListItem):
+    # Plain dict: the JSONB comes back from Postgres already decoded, so there is
+    # no need for per-key validation of the nested structure.
+    extracted_data: Optional[dict] = None
\ No newline at end of file
@@ -10,6 +10,12 @@ class UserBase(BaseModel):
 class UserCreate(UserBase):
     password: str
 
+# Summary row for list views; leaves out the JSONB profile stats
+class UserListItem(UserBase):
+    id: int
+
+    model_config = ConfigDict(from_attributes=True)
+
 class User(UserBase):
     id: int
     github_stats: Optional[Dict[str, Any]] = None
@@ -18,6 +24,10 @@ class User(UserBase):
     # Pydantic v2 configuration
     model_config = ConfigDict(from_attributes=True)
 
+# Admin profile refresh: the user plus any platform fetch that failed, by stats field
+class ProfileFetch(User):
+    fetch_errors: Dict[str, str] = {}
+
 class Token(BaseModel):
     access_token: str
     token_type: str
@@ -1,6 +1,12 @@
 import re
 from typing import Dict, List, Iterable
 
+from .ats_scorer_numba import count_words
+
+# Stored alongside cached results (Resume.ats_result). Bump it whenever scoring
+# changes, so results computed by older code are recomputed instead of served.
+SCORER_VERSION = 1
+
 CORE_SECTIONS = [
     ("summary", "Add a concise professional summary near the top."),
     ("experience", "Ensure an 'Experience' section with role details is present."),
@@ -9,6 +15,56 @@ CORE_SECTIONS = [
     ("projects", "Highlight key projects in a 'Projects' or 'Portfolio' section."),
 ]
 
+# Patterns are compiled once at import; scoring runs them on every analysis.
+_SECTION_HEADING_PATTERNS = {
+    name: re.compile(rf"^\s*{name}s?:", re.IGNORECASE | re.MULTILINE)
+    for name, _ in CORE_SECTIONS
+}
+_SECTION_WORD_PATTERNS = {
+    name: re.compile(rf"\b{name}\b", re.IGNORECASE)
+    for name, _ in CORE_SECTIONS
+}
+
+_WORD_RE = re.compile(r"\b\w+\b")
+
+# The quantified-impact patterns fused into one alternation: one scan of the text
+# instead of four, with the same "any of them matches" result.
+_METRICS_RE = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in (
+            r"\b\d{1,3}%\b",
+            r"\b\d{1,3}\s?(?:k|m|million|billion)\b",
+            r"\b\d+\s?(?:years?|projects?|people|users|clients)\b",
+            r"\b\d+\+\b",
+        )
+    ),
+    re.IGNORECASE,
+)
+
+_EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+_PHONE_RE = re.compile(r"\+?\d[\d\s\-()]{8,}")
+_LINKEDIN_RE = re.compile(r"linkedin\.com")
+
+_SIGNAL_PATTERNS = {
+    "email": _EMAIL_RE,
+    "phone": _PHONE_RE,
+    "linkedin": _LINKEDIN_RE,
+    "metrics": _METRICS_RE,
+}
+
+# All contact/impact signals as one named-group alternation, so the text is walked
+# once. Only the metric patterns are case-insensitive, as in their standalone form.
+_SIGNALS_RE = re.compile(
+    "|".join(
+        f"(?i:(?P<{name}>{pattern.pattern}))" if pattern.flags & re.IGNORECASE
+        else f"(?P<{name}>{pattern.pattern})"
+        for name, pattern in _SIGNAL_PATTERNS.items()
+    )
+)
+
+_SKILLS_LINE_RE = re.compile(r"skills?:\s*(.+)", re.IGNORECASE)
+
 
 def _gather_text(extracted_data: Dict) -> str:
     """
@@ -49,39 +105,43 @@ def _has_section(name: str, extracted_data: Dict, text: str) -> bool:
                 return True
 
     # Fallback to heading detection in raw text
-    heading_pattern = re.compile(rf"^\s*{name}s?:", re.IGNORECASE | re.MULTILINE)
+    heading_pattern = _SECTION_HEADING_PATTERNS.get(name) or re.compile(
+        rf"^\s*{name}s?:", re.IGNORECASE | re.MULTILINE
+    )
     if heading_pattern.search(text):
         return True
 
     # Additional heuristic: look for the word as a standalone heading
-    words_pattern = re.compile(rf"\b{name}\b", re.IGNORECASE)
+    words_pattern = _SECTION_WORD_PATTERNS.get(name) or re.compile(rf"\b{name}\b", re.IGNORECASE)
     return bool(words_pattern.search(text))
 
 
 def _word_count(text: str) -> int:
-    return len(re.findall(r"\b\w+\b", text))
-
-
-def _contains_quantified_metrics(text: str) -> bool:
-    patterns = [
-        r"\b\d{1,3}%\b",
-        r"\b\d{1,3}\s?(?:k|m|million|billion)\b",
-        r"\b\d+\s?(?:years?|projects?|people|users|clients)\b",
-        r"\b\d+\+\b",
-    ]
-    return any(re.search(pattern, text, re.IGNORECASE) for pattern in patterns)
+    # Byte-level compiled loop when numba is available, regex otherwise
+    return count_words(text)
 
 
-def _has_contact_info(text: str) -> Dict[str, bool]:
-    email_pattern = r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}"
-    phone_pattern = r"\+?\d[\d\s\-()]{8,}"
-    linkedin_pattern = r"linkedin\.com"
-
-    return {
-        "email": bool(re.search(email_pattern, text)),
-        "phone": bool(re.search(phone_pattern, text)),
-        "linkedin": bool(re.search(linkedin_pattern, text)),
-    }
+def _scan_signals(text: str) -> Dict[str, bool]:
+    """
+    Single pass over the text recording which contact/impact signals occur.
+    The alternation consumes what it matches, so a signal can only be missed if it
+    starts inside another signal's match; those short spans are re-checked directly.
+    """
+    found = dict.fromkeys(_SIGNAL_PATTERNS, False)
+    spans = []
+    for match in _SIGNALS_RE.finditer(text):
+        found[match.lastgroup] = True
+        spans.append(match.span())
+
+    for name, pattern in _SIGNAL_PATTERNS.items():
+        if found[name]:
+            continue
+        found[name] = any(
+            pattern.match(text, pos)
+            for start, end in spans
+            for pos in range(start, end)
+        )
+    return found
 
 
 def _skills_count(extracted_data: Dict, text: str) -> int:
@@ -93,10 +153,10 @@ def _skills_count(extracted_data: Dict, text: str) -> int:
     if isinstance(skills_section, list):
         return len([skill for skill in skills_section if isinstance(skill, str) and skill.strip()])
     if isinstance(skills_section, str):
-        return len(re.findall(r"\b\w+\b", skills_section))
+        return len(_WORD_RE.findall(skills_section))
 
     # fallback: heuristically parse a skills line from text
-    match = re.search(r"skills?:\s*(.+)", text, re.IGNORECASE)
+    match = _SKILLS_LINE_RE.search(text)
     if match:
         return len([item.strip() for item in match.group(1).split(",") if item.strip()])
 
@@ -111,6 +171,7 @@ def calculate_ats_score(extracted_data: dict, font_stats: dict, bullet_used: boo
     feedback: List[str] = []
 
     aggregated_text = _gather_text(extracted_data)
+    signals = _scan_signals(aggregated_text)
 
     # SECTION COVERAGE (35 points total, 7 each for core sections)
     for section_name, guidance in CORE_SECTIONS:
@@ -120,7 +181,7 @@ def calculate_ats_score(extracted_data: dict, font_stats: dict, bullet_used: boo
             feedback.append(guidance)
 
     # CONTACT INFORMATION (15 points: email 7, phone 5, LinkedIn 3)
-    contact_hits = _has_contact_info(aggregated_text)
+    contact_hits = {key: signals[key] for key in ("email", "phone", "linkedin")}
     if contact_hits["email"]:
         score += 7
     else:
@@ -137,7 +198,7 @@ def calculate_ats_score(extracted_data: dict, font_stats: dict, bullet_used: boo
         feedback.append("Link to your LinkedIn profile to bolster credibility.")
 
     # QUANTIFIED IMPACT (10 points)
-    if _contains_quantified_metrics(aggregated_text):
+    if signals["metrics"]:
         score += 10
     else:
         feedback.append("Add quantified achievements (e.g., “Improved efficiency by 20%”).")
@@ -0,0 +1,51 @@
+"""
+Compiled scanners for the ATS scorer's plain character loops.
+
+numba is optional: without it (or for non-ASCII text, where ``\\w`` is
+Unicode-aware) the regex implementation is used, so results are identical.
+"""
+import re
+
+import numpy as np
+
+try:
+    from numba import njit  # type: ignore
+except ImportError:  # pragma: no cover - handled gracefully
+    njit = None  # type: ignore
+
+_WORD_RE = re.compile(r"\b\w+\b")
+
+
+def _count_word_runs(buf: np.ndarray) -> int:
+    """
+    Count maximal runs of ASCII word characters ([A-Za-z0-9_]), i.e. the number of
+    ``\\b\\w+\\b`` matches in an ASCII string.
+    """
+    count = 0
+    in_word = False
+    for i in range(buf.shape[0]):
+        c = buf[i]
+        is_word = (
+            (c >= 97 and c <= 122)  # a-z
+            or (c >= 65 and c <= 90)  # A-Z
+            or (c >= 48 and c <= 57)  # 0-9
+            or c == 95  # _
+        )
+        if is_word and not in_word:
+            count += 1
+        in_word = is_word
+    return count
+
+
+if njit is not None:
+    # cache=True keeps the compiled kernel on disk, so only the first process start pays JIT cost
+    _count_word_runs = njit(cache=True, nogil=True)(_count_word_runs)
+
+
+def count_words(text: str) -> int:
+    """
+    Number of ``\\b\\w+\\b`` words in the text.
+    """
+    if njit is None or not text.isascii():
+        return sum(1 for _ in _WORD_RE.finditer(text))
+    return int(_count_word_runs(np.frombuffer(text.encode("ascii"), dtype=np.uint8)))
@@ -1,24 +1,86 @@
-def calculate_role_match(extracted_data: dict, job_description: str) -> dict:
+import re
+from functools import lru_cache
+from typing import Any, FrozenSet, Iterable, Iterator, Optional, Set
+
+# Stored with cached tokens and role-match results (Resume.tokens_cache,
+# Resume.role_match_cache). Bump it whenever tokenization or matching changes,
+# so results computed by older code are recomputed instead of served.
+MATCHER_VERSION = 1
+
+# Word-like tokens of 3+ characters, starting with a letter and ending on a letter
+# or digit, so "node.js", "ci-cd" and "c#.net" match. Short names or names ending
+# in a symbol ("go", "c#", "c++") do not.
+_TOKEN_RE = re.compile(r"\b[a-z][a-z0-9+#.-]{2,}\b")
+
+
+def _tokenize(text: str) -> Set[str]:
+    return set(_TOKEN_RE.findall(text.lower()))
+
+
+@lru_cache(maxsize=256)
+def _jd_keywords(job_description: str) -> FrozenSet[str]:
+    """
+    Keyword set for a job description. The same JD is typically matched against
+    many resumes, so the tokenized result is memoized.
+    """
+    # Short words are mostly filler ("and", "the", "you"), skip them as keywords
+    return frozenset(token for token in _tokenize(job_description) if len(token) > 3)
+
+
+def _iter_text(value: Any) -> Iterator[str]:
+    """
+    Yield every string value in the extracted structure (dict values and list items),
+    leaving out keys and repr punctuation.
+    """
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _iter_text(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _iter_text(item)
+
+
+def tokenize_resume(extracted_data: dict) -> Set[str]:
+    """
+    Keyword tokens of an extracted resume. Stored on the resume at extraction time
+    (Resume.tokens_cache) so analysis does not need to re-tokenize.
+    """
+    # Tokenized value by value, so peak memory is bounded by the largest single
+    # string instead of a joined copy of the whole document.
+    tokens: Set[str] = set()
+    for chunk in _iter_text(extracted_data):
+        tokens.update(_TOKEN_RE.findall(chunk.lower()))
+    return tokens
+
+
+def calculate_role_match(
+    extracted_data: dict,
+    job_description: str,
+    resume_tokens: Optional[Iterable[str]] = None,
+) -> dict:
     """
     Compares keywords in the resume to a job description.
-    This should be upgraded to use NLP (e.g., spaCy) for real matching.
-    """
-    # Simple, naive keyword extraction
-    jd_keywords = set([w.lower().strip(".,") for w in job_description.split() if len(w) > 3])
-    resume_text = str(extracted_data).lower() # Dump all data to a string
-    
-    found = []
-    missing = []
-    
+    Both sides are tokenized into sets, so matching is a set intersection on whole
+    tokens rather than substring search over a dump of the dict.
+    Pass precomputed resume_tokens to skip tokenizing extracted_data.
+    """
+    jd_keywords = _jd_keywords(job_description)
+
     if not jd_keywords:
         return {"percentage": 0, "found": [], "missing": []}
 
-    for keyword in jd_keywords:
-        if keyword in resume_text:
-            found.append(keyword)
-        else:
-            missing.append(keyword)
-            
+    if resume_tokens is None:
+        resume_tokens = tokenize_resume(extracted_data)
+    elif not isinstance(resume_tokens, (set, frozenset)):
+        resume_tokens = set(resume_tokens)
+
+    # Walk the (small) JD keyword set once; missing is what is left over
+    found = {keyword for keyword in jd_keywords if keyword in resume_tokens}
+    missing = jd_keywords - found
+
     percentage = int((len(found) / len(jd_keywords)) * 100)
-    
-    return {"percentage": percentage, "found": list(set(found)), "missing": list(set(missing))}
\ No newline at end of file
+
+    # Sorted so the response is stable across calls and processes
+    return {"percentage": percentage, "found": sorted(found), "missing": sorted(missing)}
@@ -0,0 +1,49 @@
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+from cachetools import TTLCache
+
+T = TypeVar("T")
+
+# Final analytics payloads per (provider function, username). Profile pages are
+# typically re-requested several times within a session.
+PROFILE_CACHE: TTLCache = TTLCache(maxsize=2048, ttl=600)
+
+
+def async_ttl_cached(cache: TTLCache) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    Cache an async function's results by its positional arguments.
+
+    Concurrent calls for a key that is not cached yet share one in-flight fetch
+    (single-flight), so a burst of requests for the same user hits upstream once.
+    Failures are not cached.
+    """
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        in_flight: Dict[Hashable, "asyncio.Future[T]"] = {}
+
+        def _finish(key: Tuple[Any, ...], task: "asyncio.Future[T]") -> None:
+            in_flight.pop(key, None)
+            if not task.cancelled() and task.exception() is None:
+                cache[key] = task.result()
+
+        @functools.wraps(func)
+        async def wrapper(*args: Hashable) -> T:
+            key = (func.__module__, func.__qualname__, *args)
+            try:
+                return cache[key]
+            except KeyError:
+                pass
+
+            task = in_flight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(func(*args))
+                in_flight[key] = task
+                task.add_done_callback(functools.partial(_finish, key))
+            # Shielded so one caller going away does not cancel the fetch for the others
+            return await asyncio.shield(task)
+
+        return wrapper
+
+    return decorator
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from datetime import datetime
 from typing import Any, Dict
 
-import httpx
-from bs4 import BeautifulSoup  # type: ignore
+from selectolax.lexbor import LexborHTMLParser  # type: ignore
+
+from .cache import PROFILE_CACHE, async_ttl_cached
+from .http_client import get_client
+from .utils import now_iso, safe_int
 
 HEADERS = {
     "User-Agent": "resume-ai-platform",
@@ -13,16 +15,16 @@ HEADERS = {
 
 
 async def _fetch_html(url: str) -> str:
-    async with httpx.AsyncClient(timeout=30, headers=HEADERS) as client:
-        resp = await client.get(url)
-        resp.raise_for_status()
-        return resp.text
+    resp = await get_client().get(url, headers=HEADERS)
+    resp.raise_for_status()
+    return resp.text
 
 
+@async_ttl_cached(PROFILE_CACHE)
 async def get_codechef_analytics(username: str) -> Dict[str, Any]:
     url = f"https://www.codechef.com/users/{username}"
     html = await _fetch_html(url)
-    soup = BeautifulSoup(html, "html.parser")
+    tree = LexborHTMLParser(html)
 
     profile: Dict[str, Any] = {"username": username}
     rating = None
@@ -30,27 +32,24 @@ async def get_codechef_analytics(username: str) -> Dict[str, Any]:
     highest = None
 
     # Rating and stars (best-effort selectors)
-    rating_el = soup.select_one(".rating-number")
+    rating_el = tree.css_first(".rating-number")
     if rating_el:
-        try:
-            rating = int(rating_el.get_text(strip=True))
-        except ValueError:
-            rating = None
-    star_el = soup.select_one(".rating-star")
+        rating = safe_int(rating_el.text(strip=True))
+    star_el = tree.css_first(".rating-star")
     if star_el:
-        stars = star_el.get_text(strip=True)
+        stars = star_el.text(strip=True)
 
     # Highest rating
-    for el in soup.select(".rating-header small"):
-        text = el.get_text(" ", strip=True).lower()
+    for el in tree.css(".rating-header small"):
+        text = el.text(separator=" ", strip=True).lower()
         if "highest rating" in text:
-            highest = el.get_text(" ", strip=True)
+            highest = el.text(separator=" ", strip=True)
             break
 
     # Languages (tags list, best-effort)
     langs = []
-    for tag in soup.select(".profile-about .content .tag-box a"):
-        txt = tag.get_text(strip=True)
+    for tag in tree.css(".profile-about .content .tag-box a"):
+        txt = tag.text(strip=True)
         if txt:
             langs.append(txt)
 
@@ -73,7 +72,7 @@ async def get_codechef_analytics(username: str) -> Dict[str, Any]:
             "solved_total": None,
             "by_difficulty": [],
         },
-        "fetched_at": datetime.utcnow().isoformat() + "Z",
+        "fetched_at": now_iso(),
         "note": "CodeChef data scraped from public profile; some fields may be unavailable.",
     }
 
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from datetime import datetime
 from typing import Any, Dict, List
 
-import httpx
-from bs4 import BeautifulSoup  # type: ignore
+from selectolax.lexbor import LexborHTMLParser  # type: ignore
+
+from .cache import PROFILE_CACHE, async_ttl_cached
+from .http_client import get_client
+from .utils import now_iso, safe_int
 
 HEADERS = {
     "User-Agent": "resume-ai-platform",
@@ -14,77 +16,73 @@ HEADERS = {
 
 
 async def _fetch_html(url: str) -> str:
-    async with httpx.AsyncClient(timeout=30, headers=HEADERS) as client:
-        resp = await client.get(url)
-        resp.raise_for_status()
-        return resp.text
+    resp = await get_client().get(url, headers=HEADERS)
+    resp.raise_for_status()
+    return resp.text
 
 
-async def fetch_profile(handle: str) -> Dict[str, Any]:
-    url = f"https://codeforces.com/profile/{handle}"
-    html = await _fetch_html(url)
-    soup = BeautifulSoup(html, "html.parser")
+def _profile_url(handle: str) -> str:
+    return f"https://codeforces.com/profile/{handle}"
+
+
+async def _fetch_profile_tree(handle: str) -> LexborHTMLParser:
+    html = await _fetch_html(_profile_url(handle))
+    return LexborHTMLParser(html)
+
 
+def _extract_profile(tree: LexborHTMLParser, handle: str) -> Dict[str, Any]:
     profile: Dict[str, Any] = {"handle": handle}
 
     # Current rating and rank (best-effort parsing)
-    rank_el = soup.select_one(".user-rank")
-    rating_el = soup.select_one(".info .user-gray, .info .user-green, .info .user-blue, .info .user-purple, .info .user-orange, .info .user-red")
-    profile["rank"] = rank_el.get_text(strip=True) if rank_el else None
-    profile["current_rating"] = None
-    if rating_el:
-        try:
-            profile["current_rating"] = int(rating_el.get_text(strip=True))
-        except ValueError:
-            profile["current_rating"] = None
-
-    # Max rating if visible
+    rank_el = tree.css_first(".user-rank")
+    rating_el = tree.css_first(".info .user-gray, .info .user-green, .info .user-blue, .info .user-purple, .info .user-orange, .info .user-red")
+    profile["rank"] = rank_el.text(strip=True) if rank_el else None
+    profile["current_rating"] = safe_int(rating_el.text(strip=True)) if rating_el else None
+
+    # Max rating if visible, plus country/organization (best effort), in one pass
     max_rating = None
-    for li in soup.select(".profile-info .info li"):
-        text = li.get_text(" ", strip=True)
-        if "Max rating" in text:
+    for li in tree.css(".profile-info .info li"):
+        text = li.text(separator=" ", strip=True)
+        if max_rating is None and "Max rating" in text:
             max_rating = text
-            break
-    profile["max_rating_text"] = max_rating
-
-    # Country/organization (best effort)
-    for li in soup.select(".profile-info .info li"):
-        text = li.get_text(" ", strip=True)
-        if text.lower().startswith("organization"):
+        lowered = text.lower()
+        if lowered.startswith("organization"):
             profile["organization"] = text.split(":", 1)[-1].strip()
-        if text.lower().startswith("country"):
+        if lowered.startswith("country"):
             profile["country"] = text.split(":", 1)[-1].strip()
+    profile["max_rating_text"] = max_rating
 
     return profile
 
 
-async def fetch_problem_stats(handle: str) -> Dict[str, Any]:
+def _extract_problem_stats(tree: LexborHTMLParser) -> Dict[str, Any]:
     """
     Best-effort parsing of solved/attempted counts from the profile page.
     Full submission history scraping is intentionally avoided to reduce load.
     """
-    url = f"https://codeforces.com/profile/{handle}"
-    html = await _fetch_html(url)
-    soup = BeautifulSoup(html, "html.parser")
-
     stats = {"solved": None, "attempted": None, "tags": [], "languages": []}
 
     # Parse a small table with "Solved" if present (site may change)
     solved_text = None
-    for el in soup.select("._UserActivityFrame_counterValue"):
+    for el in tree.css("._UserActivityFrame_counterValue"):
         # This selector may change; keep data optional
-        solved_text = el.get_text(strip=True)
+        solved_text = el.text(strip=True)
         break
     if solved_text:
-        try:
-            stats["solved"] = int(solved_text)
-        except ValueError:
-            pass
+        stats["solved"] = safe_int(solved_text)
 
     # Tags & languages are not directly exposed; keep empty
     return stats
 
 
+async def fetch_profile(handle: str) -> Dict[str, Any]:
+    return _extract_profile(await _fetch_profile_tree(handle), handle)
+
+
+async def fetch_problem_stats(handle: str) -> Dict[str, Any]:
+    return _extract_problem_stats(await _fetch_profile_tree(handle))
+
+
 async def fetch_rating_history(handle: str) -> List[Dict[str, Any]]:
     """
     Rating chart data is rendered client-side; without the official API we cannot
@@ -93,13 +91,18 @@ async def fetch_rating_history(handle: str) -> List[Dict[str, Any]]:
     return []
 
 
+@async_ttl_cached(PROFILE_CACHE)
 async def get_codeforces_analytics(handle: str) -> Dict[str, Any]:
-    profile, problem_stats, rating = await fetch_profile(handle), await fetch_problem_stats(handle), await fetch_rating_history(handle)
+    # Profile and problem stats come from the same page: download and parse it once
+    tree = await _fetch_profile_tree(handle)
+    profile = _extract_profile(tree, handle)
+    problem_stats = _extract_problem_stats(tree)
+    rating = await fetch_rating_history(handle)
     return {
         "profile": profile,
         "problems": problem_stats,
         "rating_timeline": rating,
-        "fetched_at": datetime.utcnow().isoformat() + "Z",
+        "fetched_at": now_iso(),
         "note": "Data extracted from public profile without API; some fields may be limited.",
     }
 
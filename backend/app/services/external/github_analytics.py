@@ -1,17 +1,41 @@
 import asyncio
+import re
 from collections import Counter, defaultdict
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
-from bs4 import BeautifulSoup  # type: ignore
+import orjson
+from cachetools import TTLCache
 
 from ...config import settings
+from .cache import PROFILE_CACHE, async_ttl_cached
+from .http_client import get_client
+from .utils import now_iso
 
 API_BASE = "https://api.github.com"
 USER_ENDPOINT = f"{API_BASE}/users/{{username}}"
 REPOS_ENDPOINT = f"{API_BASE}/users/{{username}}/repos"
 
+REPOS_PER_PAGE = 100
+# Pages fetched per speculative batch when the page count is unknown
+REPO_PAGE_PROBE_BATCH = 10
+# Concurrent repo-page requests when the page count is known (avoids tripping
+# GitHub's secondary rate limit for accounts with thousands of repos)
+REPO_PAGE_FETCH_CONCURRENCY = 10
+
+# Concurrent per-repo language requests (keeps us polite to the API rate limiter)
+LANGUAGE_FETCH_CONCURRENCY = 10
+
+# (url, params) -> (etag, parsed body, pagination links). Repeat requests are revalidated with
+# If-None-Match; a 304 reuses the cached body and does not count against the
+# GitHub rate limit.
+_ETAG_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=300)
+
+# The contributions page is a flat list of <rect data-*> cells; scanning the raw
+# bytes for those tags avoids building a DOM. Attribute order is not assumed.
+_RECT_TAG_RE = re.compile(rb"<rect\b([^>]*)>", re.IGNORECASE)
+_RECT_DATA_ATTR_RE = re.compile(rb'\bdata-(date|count|level)="([^"]*)"')
+
 
 def _auth_headers() -> Dict[str, str]:
     headers = {
@@ -23,57 +47,96 @@ def _auth_headers() -> Dict[str, str]:
     return headers
 
 
-async def _get_json(client: httpx.AsyncClient, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
-    response = await client.get(url, headers=_auth_headers(), params=params, timeout=30)
+async def _get_json_with_links(
+    client: httpx.AsyncClient, url: str, params: Optional[Dict[str, Any]] = None
+) -> Tuple[Any, Dict[str, Dict[str, str]]]:
+    """
+    Fetch a JSON resource along with its parsed Link header (pagination).
+    """
+    key = (url, tuple(sorted((params or {}).items())))
+    cached = _ETAG_CACHE.get(key)
+    headers = _auth_headers()
+    if cached is not None:
+        headers["If-None-Match"] = cached[0]
+
+    response = await client.get(url, headers=headers, params=params, timeout=30)
+    if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+        return cached[1], cached[2]
     response.raise_for_status()
-    return response.json()
+
+    data = orjson.loads(response.content)
+    links = response.links
+    etag = response.headers.get("ETag")
+    if etag:
+        _ETAG_CACHE[key] = (etag, data, links)
+    return data, links
+
+
+async def _get_json(client: httpx.AsyncClient, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+    data, _ = await _get_json_with_links(client, url, params)
+    return data
 
 
 async def fetch_profile(username: str) -> Dict[str, Any]:
-    async with httpx.AsyncClient() as client:
-        data = await _get_json(client, USER_ENDPOINT.format(username=username))
-        return {
-            "username": data.get("login"),
-            "name": data.get("name"),
-            "avatar_url": data.get("avatar_url"),
-            "bio": data.get("bio"),
-            "company": data.get("company"),
-            "blog": data.get("blog"),
-            "location": data.get("location"),
-            "email": data.get("email"),
-            "hireable": data.get("hireable"),
-            "public_repos": data.get("public_repos", 0),
-            "followers": data.get("followers", 0),
-            "following": data.get("following", 0),
-            "created_at": data.get("created_at"),
-            "updated_at": data.get("updated_at"),
-        }
+    data = await _get_json(get_client(), USER_ENDPOINT.format(username=username))
+    return {
+        "username": data.get("login"),
+        "name": data.get("name"),
+        "avatar_url": data.get("avatar_url"),
+        "bio": data.get("bio"),
+        "company": data.get("company"),
+        "blog": data.get("blog"),
+        "location": data.get("location"),
+        "email": data.get("email"),
+        "hireable": data.get("hireable"),
+        "public_repos": data.get("public_repos", 0),
+        "followers": data.get("followers", 0),
+        "following": data.get("following", 0),
+        "created_at": data.get("created_at"),
+        "updated_at": data.get("updated_at"),
+    }
 
 
 async def fetch_repositories(username: str) -> List[Dict[str, Any]]:
-    repos: List[Dict[str, Any]] = []
-    page = 1
+    client = get_client()
+    url = REPOS_ENDPOINT.format(username=username)
+    params = {
+        "per_page": REPOS_PER_PAGE,
+        "type": "owner",
+        "sort": "updated",
+        "direction": "desc",
+    }
 
-    async with httpx.AsyncClient() as client:
-        while True:
-            data = await _get_json(
-                client,
-                REPOS_ENDPOINT.format(username=username),
-                params={
-                    "per_page": 100,
-                    "page": page,
-                    "type": "owner",
-                    "sort": "updated",
-                    "direction": "desc",
-                },
-            )
-            if not data:
-                break
+    # Page 1's Link header (rel="last") gives the page count; the remaining
+    # pages are then fetched concurrently (bounded) instead of one round-trip at a time.
+    first_page, links = await _get_json_with_links(client, url, params={**params, "page": 1})
+    repos: List[Dict[str, Any]] = list(first_page or [])
+
+    last_url = links.get("last", {}).get("url")
+    if last_url:
+        last_page = int(httpx.URL(last_url).params.get("page", 1))
+        semaphore = asyncio.Semaphore(REPO_PAGE_FETCH_CONCURRENCY)
+
+        async def fetch_page(page: int) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await _get_json(client, url, params={**params, "page": page})
 
+        pages = await asyncio.gather(*(fetch_page(page) for page in range(2, last_page + 1)))
+        for data in pages:
             repos.extend(data)
-            if len(data) < 100:
-                break
-            page += 1
+    elif len(repos) == REPOS_PER_PAGE:
+        # Full page but no Link header: probe ahead in concurrent batches and
+        # stop at the first short page (bounded over-fetch of empty pages).
+        page = 2
+        while True:
+            batch = await asyncio.gather(
+                *(_get_json(client, url, params={**params, "page": p}) for p in range(page, page + REPO_PAGE_PROBE_BATCH))
+            )
+            for data in batch:
+                repos.extend(data)
+                if len(data) < REPOS_PER_PAGE:
+                    return repos
+            page += REPO_PAGE_PROBE_BATCH
 
     return repos
 
@@ -81,18 +144,21 @@ async def fetch_repositories(username: str) -> List[Dict[str, Any]]:
 async def fetch_languages_for_repos(repos: List[Dict[str, Any]]) -> Counter:
     language_totals: Counter = Counter()
 
-    async with httpx.AsyncClient() as client:
-        for repo in repos:
-            lang_url = repo.get("languages_url")
-            if not lang_url:
-                continue
+    client = get_client()
+    semaphore = asyncio.Semaphore(LANGUAGE_FETCH_CONCURRENCY)
 
+    async def fetch_one(lang_url: str) -> Dict[str, int]:
+        async with semaphore:
             try:
-                lang_data = await _get_json(client, lang_url)
+                return await _get_json(client, lang_url)
             except httpx.HTTPStatusError:
-                continue
+                return {}
 
-            language_totals.update(lang_data)
+    results = await asyncio.gather(
+        *(fetch_one(repo["languages_url"]) for repo in repos if repo.get("languages_url"))
+    )
+    for lang_data in results:
+        language_totals.update(lang_data)
 
     return language_totals
 
@@ -160,18 +226,20 @@ def build_repo_summary(repos: List[Dict[str, Any]]) -> Dict[str, Any]:
 
 async def fetch_contribution_heatmap(username: str) -> Dict[str, Any]:
     url = f"https://github.com/users/{username}/contributions"
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=_auth_headers(), timeout=30)
-        response.raise_for_status()
+    response = await get_client().get(url, headers=_auth_headers(), timeout=30)
+    response.raise_for_status()
 
-    soup = BeautifulSoup(response.text, "html.parser")
     heatmap_data: List[Dict[str, Any]] = []
     totals_by_month: Dict[str, int] = defaultdict(int)
+    total_contributions = 0
 
-    for rect in soup.select("rect[data-date]"):
-        date_str = rect["data-date"]
-        count = int(rect.get("data-count", 0))
-        level = int(rect.get("data-level", 0))
+    for tag in _RECT_TAG_RE.finditer(response.content):
+        attrs = dict(_RECT_DATA_ATTR_RE.findall(tag.group(1)))
+        if b"date" not in attrs:
+            continue
+        date_str = attrs[b"date"].decode()
+        count = int(attrs.get(b"count") or 0)
+        level = int(attrs.get(b"level") or 0)
 
         heatmap_data.append(
             {
@@ -183,8 +251,7 @@ async def fetch_contribution_heatmap(username: str) -> Dict[str, Any]:
 
         month = date_str[:7]  # YYYY-MM
         totals_by_month[month] += count
-
-    total_contributions = sum(entry["count"] for entry in heatmap_data)
+        total_contributions += count
 
     monthly_activity = [
         {"month": month, "contributions": totals_by_month[month]}
@@ -223,6 +290,7 @@ def build_activity_timeline(repos: List[Dict[str, Any]]) -> List[Dict[str, Any]]
     ]
 
 
+@async_ttl_cached(PROFILE_CACHE)
 async def get_github_analytics(username: str) -> Dict[str, Any]:
     repos, profile, contributions = await asyncio.gather(
         fetch_repositories(username),
@@ -242,7 +310,7 @@ async def get_github_analytics(username: str) -> Dict[str, Any]:
         "languages": language_summary,
         "contributions": contributions,
         "activity_timeline": activity_timeline,
-        "fetched_at": datetime.utcnow().isoformat() + "Z",
+        "fetched_at": now_iso(),
     }
 
 
@@ -1,34 +1,31 @@
+import asyncio
+from collections import Counter
+
 import httpx
 
-API_URL = "https://api.github.com/users"
+from . import github_analytics
 
 async def fetch_github_stats(github_link: str) -> dict:
     """
     Fetches public repo data from GitHub.
     """
-    username = github_link.split("/")[-1]
+    username = github_link.rstrip("/").split("/")[-1]
     if not username:
         return {"error": "Invalid GitHub link"}
-        
-    async with httpx.AsyncClient() as client:
-        try:
-            # 1. Get user summary
-            # user_resp = await client.get(f"{API_URL}/{username}")
-            # user_resp.raise_for_status()
-            # user_data = user_resp.json()
-            
-            # 2. Get repos
-            # repos_resp = await client.get(f"{API_URL}/{username}/repos?per_page=100")
-            # repos_resp.raise_for_status()
-            # repos_data = repos_resp.json()
-            
-            # languages = [r['language'] for r in repos_data if r['language']]
-            
-            # MOCK DATA
-            return {
-                "public_repos": 5, # user_data['public_repos'],
-                "top_languages": ["Python", "TypeScript"], # list(set(languages)),
-                "total_stars": 10 # sum(r['stargazers_count'] for r in repos_data)
-            }
-        except httpx.HTTPStatusError as e:
-            return {"error": f"GitHub API error: {e.response.status_code}"}
\ No newline at end of file
+
+    try:
+        # User summary and repo list are independent; fetch them concurrently
+        # (shared client, ETag revalidation and pagination come from github_analytics)
+        user_data, repos_data = await asyncio.gather(
+            github_analytics.fetch_profile(username),
+            github_analytics.fetch_repositories(username),
+        )
+    except httpx.HTTPStatusError as e:
+        return {"error": f"GitHub API error: {e.response.status_code}"}
+
+    languages = Counter(r["language"] for r in repos_data if r.get("language"))
+    return {
+        "public_repos": user_data["public_repos"],
+        "top_languages": [language for language, _ in languages.most_common(5)],
+        "total_stars": sum(r.get("stargazers_count", 0) for r in repos_data),
+    }
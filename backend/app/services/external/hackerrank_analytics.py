@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from datetime import datetime
 from typing import Any, Dict, List
 
-import httpx
-from bs4 import BeautifulSoup  # type: ignore
+from selectolax.lexbor import LexborHTMLParser  # type: ignore
+
+from .cache import PROFILE_CACHE, async_ttl_cached
+from .http_client import get_client
+from .utils import now_iso
 
 HEADERS = {
     "User-Agent": "resume-ai-platform",
@@ -13,12 +15,12 @@ HEADERS = {
 
 
 async def _fetch_html(url: str) -> str:
-    async with httpx.AsyncClient(timeout=30, headers=HEADERS) as client:
-        resp = await client.get(url)
-        resp.raise_for_status()
-        return resp.text
+    resp = await get_client().get(url, headers=HEADERS)
+    resp.raise_for_status()
+    return resp.text
 
 
+@async_ttl_cached(PROFILE_CACHE)
 async def get_hackerrank_analytics(username: str) -> Dict[str, Any]:
     """
     HackerRank profile pages are heavily client-rendered; without a private API we provide a minimal scrape:
@@ -27,17 +29,18 @@ async def get_hackerrank_analytics(username: str) -> Dict[str, Any]:
     """
     url = f"https://www.hackerrank.com/{username}"
     html = await _fetch_html(url)
-    soup = BeautifulSoup(html, "html.parser")
+    tree = LexborHTMLParser(html)
 
     profile: Dict[str, Any] = {"username": username}
 
     # Attempt to read title as display name
-    title = soup.title.get_text(strip=True) if soup.title else None
+    title_el = tree.css_first("title")
+    title = title_el.text(strip=True) if title_el else None
     profile["display"] = title
 
     badges = []
-    for b in soup.select(".badge-list .badge-title"):
-        txt = b.get_text(strip=True)
+    for b in tree.css(".badge-list .badge-title"):
+        txt = b.text(strip=True)
         if txt:
             badges.append(txt)
 
@@ -50,7 +53,7 @@ async def get_hackerrank_analytics(username: str) -> Dict[str, Any]:
             "note": "Domain points not reliably available without API; consider user export.",
         },
         "certificates": [],
-        "fetched_at": datetime.utcnow().isoformat() + "Z",
+        "fetched_at": now_iso(),
         "note": "HackerRank data is partially scraped; many elements are client-rendered.",
     }
 
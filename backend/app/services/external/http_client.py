@@ -0,0 +1,34 @@
+from typing import Optional
+
+import httpx
+
+# One client for every external service: connections (and TLS sessions) are pooled
+# and reused across scrapes instead of re-handshaking on every request.
+# Per-service headers (auth, Accept) are still passed on each request.
+# HTTP/2 (negotiated via ALPN, falling back to HTTP/1.1) lets concurrent requests
+# to the same host, e.g. GitHub language lookups, share one multiplexed connection.
+_client: Optional[httpx.AsyncClient] = None
+
+DEFAULT_HEADERS = {"User-Agent": "resume-ai-platform"}
+
+
+def get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            headers=DEFAULT_HEADERS,
+            timeout=httpx.Timeout(30),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    return _client
+
+
+async def aclose() -> None:
+    """
+    Close the shared client (called on application shutdown).
+    """
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
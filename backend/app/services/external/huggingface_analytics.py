@@ -1,10 +1,14 @@
+import asyncio
 from collections import defaultdict, Counter
-from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 import httpx
+import orjson
 
 from ...config import settings
+from .cache import PROFILE_CACHE, async_ttl_cached
+from .http_client import get_client
+from .utils import now_iso
 
 BASE = "https://huggingface.co/api"
 
@@ -22,48 +26,45 @@ def _auth_headers() -> Dict[str, str]:
 async def _get_json(client: httpx.AsyncClient, url: str, params: Optional[Dict[str, Any]] = None):
     resp = await client.get(url, headers=_auth_headers(), params=params, timeout=30)
     resp.raise_for_status()
-    return resp.json()
+    # orjson parses the (often large) model/dataset listings several times faster
+    return orjson.loads(resp.content)
 
 
 async def fetch_user(username: str) -> Dict[str, Any]:
     url = f"{BASE}/users/{username}"
-    async with httpx.AsyncClient() as client:
-        data = await _get_json(client, url)
-        return {
-            "name": data.get("name"),
-            "fullname": data.get("fullname"),
-            "avatarUrl": data.get("avatarUrl"),
-            "type": data.get("type"),  # user / org
-            "bio": data.get("bio"),
-            "website": data.get("website"),
-            "location": data.get("location"),
-            "joined": data.get("joined"),
-            "likes": data.get("likes"),
-        }
+    data = await _get_json(get_client(), url)
+    return {
+        "name": data.get("name"),
+        "fullname": data.get("fullname"),
+        "avatarUrl": data.get("avatarUrl"),
+        "type": data.get("type"),  # user / org
+        "bio": data.get("bio"),
+        "website": data.get("website"),
+        "location": data.get("location"),
+        "joined": data.get("joined"),
+        "likes": data.get("likes"),
+    }
 
 
 async def fetch_models(username: str) -> List[Dict[str, Any]]:
     # https://huggingface.co/api/models?author={username}&full=true
     url = f"{BASE}/models"
     params = {"author": username, "full": "true"}
-    async with httpx.AsyncClient() as client:
-        return await _get_json(client, url, params=params)
+    return await _get_json(get_client(), url, params=params)
 
 
 async def fetch_datasets(username: str) -> List[Dict[str, Any]]:
     # https://huggingface.co/api/datasets?author={username}&full=true
     url = f"{BASE}/datasets"
     params = {"author": username, "full": "true"}
-    async with httpx.AsyncClient() as client:
-        return await _get_json(client, url, params=params)
+    return await _get_json(get_client(), url, params=params)
 
 
 async def fetch_spaces(username: str) -> List[Dict[str, Any]]:
     # https://huggingface.co/api/spaces?author={username}&full=true
     url = f"{BASE}/spaces"
     params = {"author": username, "full": "true"}
-    async with httpx.AsyncClient() as client:
-        return await __get_json(client, url, params=params)
+    return await _get_json(get_client(), url, params=params)
 
 
 def _agg_items(items: List[Dict[str, Any]], kind: str) -> Dict[str, Any]:
@@ -125,15 +126,17 @@ def _agg_items(items: List[Dict[str, Any]], kind: str) -> Dict[str, Any]:
     }
 
 
+@async_ttl_cached(PROFILE_CACHE)
 async def get_hf_analytics(username: str) -> Dict[str, Any]:
-    models, datasets, spaces, user = await httpx.AsyncClient().run(None)  # type: ignore
-    # The above line is a placeholder; we’ll fetch concurrently below.
-    async with httpx.AsyncClient() as client:
-        # Fetch in sequence to keep it simple and robust; can switch to asyncio.gather if desired.
-        user = await _get_json(client, f"{BASE}/users/{username}")
-        models = await _get_json(client, f"{BASE}/models", params={"author": username, "full": "true"})
-        datasets = await _get_json(client, f"{BASE}/datasets", params={"author": username, "full": "true"})
-        spaces = await _get_json(client, f"{BASE}/spaces", params={"author": username, "full": "true"})
+    client = get_client()
+    # The four requests are independent; run them concurrently
+    params = {"author": username, "full": "true"}
+    user, models, datasets, spaces = await asyncio.gather(
+        _get_json(client, f"{BASE}/users/{username}"),
+        _get_json(client, f"{BASE}/models", params=params),
+        _get_json(client, f"{BASE}/datasets", params=params),
+        _get_json(client, f"{BASE}/spaces", params=params),
+    )
 
     models_summary = _agg_items(models, "models")
     datasets_summary = _agg_items(datasets, "datasets")
@@ -157,6 +160,6 @@ async def get_hf_analytics(username: str) -> Dict[str, Any]:
         "models": models_summary,
         "datasets": datasets_summary,
         "spaces": spaces_summary,
-        "fetched_at": datetime.utcnow().isoformat() + "Z",
+        "fetched_at": now_iso(),
     }
 
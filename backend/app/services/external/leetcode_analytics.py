@@ -1,32 +1,46 @@
 from __future__ import annotations
 
-import json
 from collections import defaultdict
-from datetime import datetime
+from datetime import date, timedelta
 from typing import Any, Dict, List
 
-import httpx
-from bs4 import BeautifulSoup  # type: ignore
+import orjson
+from bs4 import BeautifulSoup, SoupStrainer  # type: ignore
+
+from .cache import PROFILE_CACHE, async_ttl_cached
+from .http_client import get_client
+from .utils import now_iso
 
 HEADERS = {
     "User-Agent": "resume-ai-platform",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
 }
 
+# Only the Next.js payload is needed; don't build a tree for the rest of the page
+_NEXT_DATA_STRAINER = SoupStrainer("script", id="__NEXT_DATA__")
+
 
 async def _fetch_html(url: str) -> str:
-    async with httpx.AsyncClient(timeout=30, headers=HEADERS) as client:
-        resp = await client.get(url)
-        resp.raise_for_status()
-        return resp.text
+    resp = await get_client().get(url, headers=HEADERS)
+    resp.raise_for_status()
+    return resp.text
+
 
+# Roots shared by every field we read from __NEXT_DATA__
+_MATCHED_USER_PATH = ["props", "pageProps", "dehydratedState", "queries", 0, "state", "data", "matchedUser"]
+_PROFILE_COMMUNITY_PATH = ["props", "pageProps", "profileCommunity"]
 
-def _safe_get(d: Any, path: List[str], default=None):
+_EPOCH = date(1970, 1, 1)
+
+
+def _safe_get(d: Any, path: List[Any], default=None):
     cur = d
     try:
         for k in path:
             if isinstance(cur, dict):
                 cur = cur.get(k)
+            elif isinstance(cur, list) and isinstance(k, int):
+                cur = cur[k] if -len(cur) <= k < len(cur) else None
             else:
                 return default
         return cur if cur is not None else default
@@ -39,13 +53,14 @@ def _parse_next_data(html: str) -> Dict[str, Any]:
     LeetCode profile pages are Next.js apps. Public data is embedded in a script tag with id="__NEXT_DATA__".
     We'll parse it and extract stable fields if present. LeetCode may change structure at any time; code is defensive.
     """
-    soup = BeautifulSoup(html, "html.parser")
-    script = soup.find("script", {"id": "__NEXT_DATA__"})
+    soup = BeautifulSoup(html, "lxml", parse_only=_NEXT_DATA_STRAINER)
+    script = soup.find("script")
     if not script or not script.string:
         return {}
     try:
-        return json.loads(script.string)
-    except json.JSONDecodeError:
+        # orjson only accepts exact str/bytes; bs4 hands back a NavigableString subclass
+        return orjson.loads(str(script.string))
+    except orjson.JSONDecodeError:
         return {}
 
 
@@ -56,8 +71,8 @@ def _build_heatmap(submission_calendar: str | Dict[str, Any]) -> Dict[str, Any]:
     data_map: Dict[str, int] = {}
     if isinstance(submission_calendar, str):
         try:
-            data_map = json.loads(submission_calendar)
-        except json.JSONDecodeError:
+            data_map = orjson.loads(submission_calendar)
+        except orjson.JSONDecodeError:
             data_map = {}
     elif isinstance(submission_calendar, dict):
         data_map = {str(k): int(v) for (k, v) in submission_calendar.items()}
@@ -69,28 +84,26 @@ def _build_heatmap(submission_calendar: str | Dict[str, Any]) -> Dict[str, Any]:
     for ts_str, count in data_map.items():
         try:
             ts = int(ts_str)
-            date = datetime.utcfromtimestamp(ts).strftime("%Y-%m-%d")
+            # Calendar day arithmetic instead of a datetime + strftime per entry
+            day = (_EPOCH + timedelta(days=ts // 86400)).isoformat()
         except Exception:
             # Sometimes key may already be a date
-            date = ts_str
+            day = ts_str
         c = int(count)
         total += c
-        heatmap.append({"date": date, "count": c})
-        monthly[date[:7]] += c
+        heatmap.append({"date": day, "count": c})
+        monthly[day[:7]] += c
 
     monthly_activity = [{"month": m, "submissions": monthly[m]} for m in sorted(monthly.keys())]
     return {"total_submissions": total, "heatmap": heatmap, "monthly_activity": monthly_activity}
 
 
-def _difficulty_breakdown(next_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+def _difficulty_breakdown(matched_user: Dict[str, Any], profile_community: Dict[str, Any]) -> List[Dict[str, Any]]:
     # Try multiple known paths used historically by LeetCode
     # 1) pagesProps.profileCommunity/progressBar, or matchedUser.submitStatsGlobal
     diffs: Dict[str, int] = {"Easy": 0, "Medium": 0, "Hard": 0}
 
-    ac_list = _safe_get(
-        next_data,
-        ["props", "pageProps", "dehydratedState", "queries", 0, "state", "data", "matchedUser", "submitStats", "acSubmissionNum"],
-    )
+    ac_list = _safe_get(matched_user, ["submitStats", "acSubmissionNum"])
     if isinstance(ac_list, list):
         for item in ac_list:
             difficulty = item.get("difficulty")
@@ -100,7 +113,7 @@ def _difficulty_breakdown(next_data: Dict[str, Any]) -> List[Dict[str, Any]]:
 
     # Fallback older path
     if sum(diffs.values()) == 0:
-        progress = _safe_get(next_data, ["props", "pageProps", "profileCommunity", "submissionProgress"], {})
+        progress = profile_community.get("submissionProgress") or {}
         if isinstance(progress, dict):
             diffs["Easy"] = int(progress.get("easySolved", 0))
             diffs["Medium"] = int(progress.get("mediumSolved", 0))
@@ -109,15 +122,11 @@ def _difficulty_breakdown(next_data: Dict[str, Any]) -> List[Dict[str, Any]]:
     return [{"difficulty": k, "solved": v} for k, v in diffs.items()]
 
 
-def _languages_stats(next_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+def _languages_stats(matched_user: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     Try to infer languages used by looking at 'languageProblemCount' if present in public data.
     """
-    langs = _safe_get(
-        next_data,
-        ["props", "pageProps", "dehydratedState", "queries", 0, "state", "data", "matchedUser", "languageProblemCount"],
-        [],
-    )
+    langs = matched_user.get("languageProblemCount") or []
     results = []
     if isinstance(langs, list):
         for item in langs:
@@ -128,6 +137,7 @@ def _languages_stats(next_data: Dict[str, Any]) -> List[Dict[str, Any]]:
     return results
 
 
+@async_ttl_cached(PROFILE_CACHE)
 async def get_leetcode_analytics(username: str) -> Dict[str, Any]:
     """
     Scrape the LeetCode public profile page (no API). Extract:
@@ -140,31 +150,35 @@ async def get_leetcode_analytics(username: str) -> Dict[str, Any]:
     html = await _fetch_html(url)
     next_data = _parse_next_data(html)
 
+    # Resolve the two shared roots once; every field below is read relative to them
+    matched_user = _safe_get(next_data, _MATCHED_USER_PATH, {})
+    if not isinstance(matched_user, dict):
+        matched_user = {}
+    profile_community = _safe_get(next_data, _PROFILE_COMMUNITY_PATH, {})
+    if not isinstance(profile_community, dict):
+        profile_community = {}
+
     # Profile basics (best effort)
     profile = {
         "username": username,
-        "name": _safe_get(next_data, ["props", "pageProps", "profileCommunity", "profile", "realName"]),
-        "avatar": _safe_get(next_data, ["props", "pageProps", "profileCommunity", "profile", "userAvatar"]),
-        "ranking": _safe_get(next_data, ["props", "pageProps", "dehydratedState", "queries", 0, "state", "data", "matchedUser", "ranking"]),
+        "name": _safe_get(profile_community, ["profile", "realName"]),
+        "avatar": _safe_get(profile_community, ["profile", "userAvatar"]),
+        "ranking": matched_user.get("ranking"),
     }
 
     # Submission calendar
-    submission_calendar = _safe_get(
-        next_data,
-        ["props", "pageProps", "dehydratedState", "queries", 0, "state", "data", "matchedUser", "submissionCalendar"],
-        {},
-    )
+    submission_calendar = matched_user.get("submissionCalendar") or {}
     heatmap = _build_heatmap(submission_calendar)
 
-    difficulties = _difficulty_breakdown(next_data)
-    languages = _languages_stats(next_data)
+    difficulties = _difficulty_breakdown(matched_user, profile_community)
+    languages = _languages_stats(matched_user)
 
     return {
         "profile": profile,
         "submissions": heatmap,
         "difficulties": difficulties,
         "languages": languages,
-        "fetched_at": datetime.utcnow().isoformat() + "Z",
+        "fetched_at": now_iso(),
         "note": "This data is parsed from public Next.js payload; fields may change.",
     }
 
@@ -0,0 +1,21 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+
+def safe_int(text: Optional[str], default: Optional[int] = None) -> Optional[int]:
+    """
+    Parse a scraped integer, returning default for missing or non-numeric text.
+    Checked up front rather than via try/except, since malformed values are common.
+    """
+    if text is None:
+        return default
+    text = text.strip()
+    digits = text[1:] if text[:1] in ("+", "-") else text
+    return int(text) if digits.isdecimal() else default
+
+
+def now_iso() -> str:
+    """
+    Current UTC time as an ISO-8601 string with a 'Z' suffix (for fetched_at stamps).
+    """
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
@@ -0,0 +1,55 @@
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from diskcache import Cache
+
+# Extracted blocks keyed by extractor + file content hash. On disk (SQLite-backed)
+# rather than in memory so every extraction pool worker shares it, and it survives
+# restarts; re-extracting the same upload is common (retries, re-analysis).
+# Anchored to the backend directory, not the working directory; override with
+# the EXTRACTION_CACHE_DIR setting.
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[3] / "extraction_cache"
+CACHE_SIZE_LIMIT = 512 * 1024 * 1024
+
+# Part of every key. Bump it whenever an extractor's output (block fields,
+# coordinates, ordering) changes, so blocks cached by older code are never served.
+CACHE_VERSION = 1
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# Opened lazily, once per process
+_cache: Optional[Cache] = None
+
+
+def _get_cache() -> Cache:
+    global _cache
+    if _cache is None:
+        from ...config import settings
+
+        cache_dir = settings.EXTRACTION_CACHE_DIR or DEFAULT_CACHE_DIR
+        _cache = Cache(str(cache_dir), size_limit=CACHE_SIZE_LIMIT)
+    return _cache
+
+
+def file_digest(file_path: str) -> str:
+    """
+    blake2b of the file contents; a few ms even for large uploads, against seconds of OCR.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as fp:
+        while chunk := fp.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def lookup(namespace: str, file_path: str) -> Tuple[str, Optional[List[Dict]]]:
+    """
+    Returns (key, cached blocks or None). Pass the key to store() on a miss.
+    """
+    key = f"v{CACHE_VERSION}:{namespace}:{file_digest(file_path)}"
+    return key, _get_cache().get(key)
+
+
+def store(key: str, blocks: List[Dict]) -> None:
+    _get_cache().set(key, blocks)
@@ -1,57 +1,86 @@
 from typing import List, Dict
 
+import numpy as np
 from docx import Document
 
 
-def _paragraph_blocks(doc: Document) -> List[Dict]:
+def _new_columns() -> Dict[str, list]:
+    """
+    Block fields accumulated as parallel lists (one entry per block); dicts are only
+    built once, in final reading order. x0/x1/y1 follow from column and y0.
+    """
+    return {"text": [], "y0": [], "column": [], "type": [], "table_row": [], "table_col": []}
+
+
+def _paragraph_blocks(doc: Document, cols: Dict[str, list]) -> None:
     """
     Convert paragraphs into pseudo-blocks. DOCX does not expose coordinates,
     so we provide order-based positions and mark them as single-column content.
     """
-    blocks = []
     order = 0
     for para in doc.paragraphs:
-        text = para.text.strip()
-        if not text:
+        raw = para.text
+        # Blank paragraphs are common; reject them without allocating a stripped copy
+        if not raw or raw.isspace():
             continue
-        blocks.append({
-            "text": text,
-            "x0": 0,
-            "y0": float(order),
-            "x1": 100,
-            "y1": float(order + 1),
-            "column": 0,
-            "type": "paragraph",
-        })
+        text = raw.strip()
+        cols["text"].append(text)
+        cols["y0"].append(float(order))
+        cols["column"].append(0)
+        cols["type"].append("paragraph")
+        cols["table_row"].append(None)
+        cols["table_col"].append(None)
         order += 1
-    return blocks
 
 
-def _table_blocks(doc: Document, start_order: int) -> List[Dict]:
+def _table_blocks(doc: Document, cols: Dict[str, list], start_order: int) -> None:
     """
     Extract tables cell by cell to avoid losing information such as multi-column layouts.
     We treat each cell as an individual block and note its row/column position.
     """
-    blocks = []
     order = start_order
     for table in doc.tables:
         for row_idx, row in enumerate(table.rows):
             for col_idx, cell in enumerate(row.cells):
-                text = cell.text.strip()
-                if not text:
+                raw = cell.text
+                if not raw or raw.isspace():
                     continue
-                blocks.append({
-                    "text": text,
-                    "x0": float(col_idx * 100),
-                    "y0": float(order),
-                    "x1": float((col_idx + 1) * 100),
-                    "y1": float(order + 1),
-                    "column": col_idx,
-                    "type": "table_cell",
-                    "table_row": row_idx,
-                    "table_col": col_idx,
-                })
+                text = raw.strip()
+                cols["text"].append(text)
+                cols["y0"].append(float(order))
+                cols["column"].append(col_idx)
+                cols["type"].append("table_cell")
+                cols["table_row"].append(row_idx)
+                cols["table_col"].append(col_idx)
                 order += 1
+
+
+def _materialize(cols: Dict[str, list], order: np.ndarray) -> List[Dict]:
+    blocks = []
+    for i in order.tolist():
+        column, y0 = cols["column"][i], cols["y0"][i]
+        if cols["type"][i] == "paragraph":
+            blocks.append({
+                "text": cols["text"][i],
+                "x0": 0,
+                "y0": y0,
+                "x1": 100,
+                "y1": y0 + 1,
+                "column": 0,
+                "type": "paragraph",
+            })
+        else:
+            blocks.append({
+                "text": cols["text"][i],
+                "x0": float(column * 100),
+                "y0": y0,
+                "x1": float((column + 1) * 100),
+                "y1": y0 + 1,
+                "column": column,
+                "type": "table_cell",
+                "table_row": cols["table_row"][i],
+                "table_col": cols["table_col"][i],
+            })
     return blocks
 
 
@@ -61,10 +90,13 @@ def extract(file_path: str) -> List[Dict]:
     Column metadata is inferred where possible (tables); otherwise default to single column.
     """
     doc = Document(file_path)
-    paragraph_blocks = _paragraph_blocks(doc)
-    table_blocks = _table_blocks(doc, start_order=len(paragraph_blocks))
+    cols = _new_columns()
+    _paragraph_blocks(doc, cols)
+    _table_blocks(doc, cols, start_order=len(cols["text"]))
 
-    blocks = paragraph_blocks + table_blocks
-    # Sort by synthetic y coordinate to preserve reading order
-    blocks.sort(key=lambda b: (b.get("column", 0), b["y0"]))
-    return blocks
+    # Sort by column, then synthetic y coordinate, to preserve reading order
+    order = np.lexsort((
+        np.asarray(cols["y0"], dtype=np.float64),
+        np.asarray(cols["column"], dtype=np.int64),
+    ))
+    return _materialize(cols, order)
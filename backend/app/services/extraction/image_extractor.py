@@ -1,18 +1,53 @@
+import asyncio
+import functools
+import threading
 from typing import List, Dict, Tuple, Optional, Set
 
+import numpy as np
+
+from . import cache as extraction_cache
+
 # PaddleOCR (primary OCR engine) - defer import to runtime to avoid startup crashes
 PaddleOCR = None  # type: ignore
 
-# Tesseract (fallback / supplementary OCR)
-try:
-    import pytesseract  # type: ignore
-    from PIL import Image  # type: ignore
-except ImportError:  # pragma: no cover - handled gracefully
-    pytesseract = None  # type: ignore
-    Image = None  # type: ignore
+
+@functools.lru_cache(maxsize=1)
+def _tesseract_modules():
+    """
+    Tesseract (fallback / supplementary OCR), imported on first use and cached.
+    Returns (tesserocr, pytesseract, PIL.Image); each is None when not installed.
+    tesserocr binds libtesseract in-process; pytesseract shells out per image.
+    """
+    try:
+        from PIL import Image  # type: ignore
+    except ImportError:  # pragma: no cover - handled gracefully
+        return None, None, None
+    try:
+        import tesserocr  # type: ignore
+    except ImportError:  # pragma: no cover - optional
+        tesserocr = None
+    try:
+        import pytesseract  # type: ignore
+    except ImportError:  # pragma: no cover - handled gracefully
+        pytesseract = None
+    return tesserocr, pytesseract, Image
+
+
+# Longest image side (px) handed to Tesseract; larger scans are downscaled first,
+# since resolution beyond ~300 DPI only slows recognition down
+TESSERACT_MAX_SIDE = 2000
+
+# One tesserocr API handle per worker thread: loading tessdata is the expensive part
+# of a call, and a handle must not be shared between threads
+_tess_local = threading.local()
 
 # Lazy-loaded singleton to avoid re-initialising the heavy Paddle model
 _paddle_ocr_instance: Optional[PaddleOCR] = None  # type: ignore
+# OCR engines run in worker threads; make sure only one of them builds the model
+_paddle_init_lock = threading.Lock()
+# ...and only one of them runs it at a time: Paddle's predictor is not thread-safe.
+# Tesseract does not take this lock, so it still overlaps with Paddle.
+_paddle_run_lock = threading.Lock()
 
 def _get_paddle_ocr() -> PaddleOCR:
     """
@@ -35,7 +70,14 @@ def _get_paddle_ocr() -> PaddleOCR:
         )
 
     if _paddle_ocr_instance is None:
-        _paddle_ocr_instance = _PaddleOCR(use_angle_cls=True, lang="en")
+        with _paddle_init_lock:
+            if _paddle_ocr_instance is None:
+                _paddle_ocr_instance = _PaddleOCR(
+                    use_angle_cls=True,
+                    lang="en",
+                    rec_batch_num=16,  # recognise more text lines per inference call
+                    det_limit_side_len=960,  # bound detection input size (and memory)
+                )
 
     return _paddle_ocr_instance
 
@@ -45,41 +87,64 @@ def _paddle_blocks(file_path: str) -> List[Dict]:
     Run PaddleOCR on the image and convert results into our uniform block schema.
     """
     ocr = _get_paddle_ocr()
-    result = ocr.ocr(file_path, cls=True)
+    with _paddle_run_lock:
+        result = ocr.ocr(file_path, cls=True)
+    return _paddle_result_to_blocks(result)
 
+
+def _paddle_result_to_blocks(result) -> List[Dict]:
     blocks: List[Dict] = []
     for page in result:
-        for line in page:
-            bbox, (text, confidence) = line
-            # bbox is a list of 4 points [ [x, y], ... ]
-            xs = [point[0] for point in bbox]
-            ys = [point[1] for point in bbox]
+        # Paddle returns None for a page without any detected text
+        if not page:
+            continue
+        # Each bbox is a list of 4 points [ [x, y], ... ]; reduce the whole page's
+        # (N, 4, 2) array at once instead of four min/max calls per line
+        boxes = np.asarray([line[0] for line in page], dtype=np.float64)
+        mins = boxes.min(axis=1).tolist()
+        maxs = boxes.max(axis=1).tolist()
+        for (_, (text, confidence)), (x0, y0), (x1, y1) in zip(page, mins, maxs):
             blocks.append({
                 "text": text.strip(),
-                "x0": float(min(xs)),
-                "y0": float(min(ys)),
-                "x1": float(max(xs)),
-                "y1": float(max(ys)),
+                "x0": x0,
+                "y0": y0,
+                "x1": x1,
+                "y1": y1,
                 "confidence": float(confidence),
                 "engine": "paddleocr",
             })
     return blocks
 
 
-def _tesseract_blocks(file_path: str) -> List[Dict]:
-    """
-    Optional supplementary OCR using Tesseract (if installed and configured).
-    """
-    if pytesseract is None or Image is None:
+def _tesserocr_words(tesserocr, image) -> List[Tuple[str, float, float, float, float, float]]:
+    api = getattr(_tess_local, "api", None)
+    if api is None:
+        api = _tess_local.api = tesserocr.PyTessBaseAPI()
+
+    api.SetImage(image)
+    api.Recognize()
+    iterator = api.GetIterator()
+    if iterator is None:
         return []
 
-    image = Image.open(file_path)
+    words = []
+    level = tesserocr.RIL.WORD
+    for word in tesserocr.iterate_level(iterator, level):
+        text = (word.GetUTF8Text(level) or "").strip()
+        if not text:
+            continue
+        x0, y0, x1, y1 = word.BoundingBox(level)
+        words.append((text, x0, y0, x1, y1, float(word.Confidence(level))))
+    return words
+
+
+def _pytesseract_words(pytesseract, image) -> List[Tuple[str, float, float, float, float, float]]:
     data = pytesseract.image_to_data(
         image,
         output_type=pytesseract.Output.DICT  # type: ignore[attr-defined]
     )
 
-    blocks: List[Dict] = []
+    words = []
     n_boxes = len(data["text"])
     for i in range(n_boxes):
         text = data["text"][i].strip()
@@ -96,33 +161,68 @@ def _tesseract_blocks(file_path: str) -> List[Dict]:
             confidence = float(conf)
         except (TypeError, ValueError):
             confidence = -1.0
+        words.append((text, x, y, x + w, y + h, confidence))
+    return words
+
+
+def _tesseract_blocks(file_path: str) -> List[Dict]:
+    """
+    Optional supplementary OCR using Tesseract (if installed and configured).
+    Prefers a reused in-process tesserocr handle over a pytesseract subprocess.
+    """
+    tesserocr, pytesseract, Image = _tesseract_modules()
+    if Image is None or (tesserocr is None and pytesseract is None):
+        return []
+
+    with Image.open(file_path) as image:
+        width = image.width
+        if max(image.size) > TESSERACT_MAX_SIDE:
+            image.thumbnail((TESSERACT_MAX_SIDE, TESSERACT_MAX_SIDE), Image.LANCZOS)
+        # Boxes are reported on the downscaled image; map them back to source pixels
+        scale = width / image.width
+
+        if tesserocr is not None:
+            words = _tesserocr_words(tesserocr, image)
+        else:
+            words = _pytesseract_words(pytesseract, image)
 
-        blocks.append({
+    return [
+        {
             "text": text,
-            "x0": float(x),
-            "y0": float(y),
-            "x1": float(x + w),
-            "y1": float(y + h),
+            "x0": float(x0 * scale),
+            "y0": float(y0 * scale),
+            "x1": float(x1 * scale),
+            "y1": float(y1 * scale),
             "confidence": confidence,
             "engine": "tesseract",
-        })
-    return blocks
+        }
+        for text, x0, y0, x1, y1, confidence in words
+    ]
 
 
 def _deduplicate_blocks(blocks: List[Dict]) -> List[Dict]:
     """
     Deduplicate overlapping results coming from multiple OCR engines by (text, bbox).
     """
-    seen: Set[Tuple[str, float, float, float, float]] = set()
+    if not blocks:
+        return []
+
+    # Quantise every bbox in one vectorised pass to hundredths of a pixel (the same
+    # 2-decimal rounding as np.round(coords, 2)), then pack the four values as 32-bit
+    # fields into two 64-bit words so each key hashes two ints instead of four floats.
+    # Exact for |coordinate| < 21 million px.
+    coords = np.array(
+        [(block["x0"], block["y0"], block["x1"], block["y1"]) for block in blocks],
+        dtype=np.float64,
+    )
+    q = (np.rint(coords * 100).astype(np.int64) & 0xFFFFFFFF).astype(np.uint64)
+    hi = ((q[:, 0] << np.uint64(32)) | q[:, 1]).tolist()
+    lo = ((q[:, 2] << np.uint64(32)) | q[:, 3]).tolist()
+
+    seen: Set[Tuple[str, int, int]] = set()
     unique_blocks: List[Dict] = []
-    for block in blocks:
-        key = (
-            block["text"],
-            round(block["x0"], 2),
-            round(block["y0"], 2),
-            round(block["x1"], 2),
-            round(block["y1"], 2),
-        )
+    for block, bbox_hi, bbox_lo in zip(blocks, hi, lo):
+        key = (block["text"], bbox_hi, bbox_lo)
         if key in seen:
             continue
         seen.add(key)
@@ -140,12 +240,27 @@ async def extract(file_path: str, use_tesseract: bool = True) -> List[Dict]:
 
     Returns:
         List of block dictionaries with text, coordinates, confidence, and engine.
+        Cached by file content, so re-extracting the same image skips OCR.
     """
-    paddle_results = _paddle_blocks(file_path)
-    tesseract_results: List[Dict] = []
+    namespace = "image+tesseract" if use_tesseract else "image"
+    key, blocks = await asyncio.to_thread(extraction_cache.lookup, namespace, file_path)
+    if blocks is None:
+        blocks = await _extract(file_path, use_tesseract)
+        await asyncio.to_thread(extraction_cache.store, key, blocks)
+    return blocks
+
 
+async def _extract(file_path: str, use_tesseract: bool) -> List[Dict]:
+    # Both engines are blocking (Paddle inference, a Tesseract subprocess); run them
+    # in worker threads so they overlap and the event loop stays free meanwhile.
+    paddle_task = asyncio.to_thread(_paddle_blocks, file_path)
     if use_tesseract:
-        tesseract_results = _tesseract_blocks(file_path)
+        paddle_results, tesseract_results = await asyncio.gather(
+            paddle_task, asyncio.to_thread(_tesseract_blocks, file_path)
+        )
+    else:
+        paddle_results, tesseract_results = await paddle_task, []
 
     combined = paddle_results + tesseract_results
-    return _deduplicate_blocks(combined)
\ No newline at end of file
+    return _deduplicate_blocks(combined)
+
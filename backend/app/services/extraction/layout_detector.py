@@ -1,46 +1,90 @@
 import numpy as np
-from sklearn.cluster import KMeans
-from sklearn.metrics import silhouette_score
+
+from .layout_detector_numba import best_splits
+
+# A further column split is accepted only if it removes at least this share of the
+# remaining within-column variance of x0.
+MIN_SPLIT_GAIN = 0.6
+
+
+def _sse(S: np.ndarray, Q: np.ndarray, i, j):
+    """
+    Sum of squared deviations of xs[i:j], in O(1) from prefix sums of xs and xs**2.
+    i and j may be index arrays.
+    """
+    return (Q[j] - Q[i]) - (S[j] - S[i]) ** 2 / (j - i)
+
+
+def _is_column_layout(splits: list, xs: np.ndarray, x1s: np.ndarray) -> bool:
+    """
+    Columns sit side by side: each one must start where the blocks of the column to
+    its left typically end. This rejects indentation (bullets, nested entries),
+    which also splits x0 into tight groups but within a single column.
+    """
+    edges = [0, *splits, len(xs)]
+    for lo, hi, next_hi in zip(edges, edges[1:], edges[2:]):
+        if np.median(x1s[lo:hi]) > np.mean(xs[hi:next_hi]):
+            return False
+    return True
+
 
 def detect_layout(blocks: list) -> dict:
     """
-    Applies KMeans clustering on x-coordinates to detect 1, 2, or 3-column layouts.
+    Detects 1, 2, or 3-column layouts by optimally segmenting the blocks' x-coordinates.
     This works best with the 'LTTextBox' blocks from pdfminer.
+
+    Clustering a single dimension does not need KMeans: optimal 1-D clusters are
+    contiguous runs of the sorted values, so every 2- and 3-way split is scored
+    exactly with prefix sums.
     """
     if not blocks:
         return {"columns": 1, "column_centers": []}
 
     # Use the starting x-coordinate of each block
-    x_coords = np.array([[b['x0']] for b in blocks])
+    x_coords = np.fromiter((b['x0'] for b in blocks), dtype=np.float64, count=len(blocks))
+    x_ends = np.fromiter((b['x1'] for b in blocks), dtype=np.float64, count=len(blocks))
 
     if len(x_coords) < 3: # Not enough data to cluster
-         return {"columns": 1, "column_centers": [np.mean(x_coords)]}
-
-    scores = {}
-    models = {}
-
-    # Test for 1, 2, and 3 columns
-    for n_clusters in range(1, 4):
-        # KMeans requires at least as many samples as clusters
-        if len(x_coords) < n_clusters:
-            continue
-        
-        if n_clusters == 1:
-            scores[1] = 1.0 # Base score for 1 cluster
-            models[1] = KMeans(n_clusters=1, n_init=10).fit(x_coords)
-            continue
-
-        kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10).fit(x_coords)
-        # Silhouette score requires at least 2 clusters
-        score = silhouette_score(x_coords, kmeans.labels_)
-        scores[n_clusters] = score
-        models[n_clusters] = kmeans
-        
-    # Best score wins
-    best_n = max(scores, key=scores.get)
-    best_model = models[best_n]
-    
-    # Get the x-coordinate of each column center
-    centers = sorted(best_model.cluster_centers_.flatten().tolist())
-    
-    return {"columns": best_n, "column_centers": centers, "labels": best_model.labels_.tolist()}
\ No newline at end of file
+         return {"columns": 1, "column_centers": [float(np.mean(x_coords))]}
+
+    order = np.argsort(x_coords, kind="stable")
+    xs, x1s = x_coords[order], x_ends[order]
+    n = len(xs)
+    S = np.concatenate(([0.0], np.cumsum(xs)))
+    Q = np.concatenate(([0.0], np.cumsum(xs * xs)))
+
+    cost1 = _sse(S, Q, 0, n)
+
+    if best_splits is not None:
+        # Compiled scan over every 2- and 3-way split (numba available)
+        cost2, s2, cost3, s3, t3 = best_splits(S, Q)
+        splits2, splits3 = [s2], [s3, t3]
+    else:
+        # Best 2-column split: xs[:s] | xs[s:]
+        s = np.arange(1, n)
+        costs = _sse(S, Q, 0, s) + _sse(S, Q, s, n)
+        best = int(np.argmin(costs))
+        cost2, splits2 = costs[best], [int(s[best])]
+
+        # Best 3-column split: xs[:s] | xs[s:t] | xs[t:]
+        cost3, splits3 = np.inf, None
+        for t in range(2, n):
+            s = np.arange(1, t)
+            costs = _sse(S, Q, 0, s) + _sse(S, Q, s, t)
+            best = int(np.argmin(costs))
+            cost = costs[best] + _sse(S, Q, t, n)
+            if cost < cost3:
+                cost3, splits3 = cost, [int(s[best]), t]
+
+    splits = []
+    if cost1 > 0 and cost2 <= (1 - MIN_SPLIT_GAIN) * cost1 and _is_column_layout(splits2, xs, x1s):
+        splits = splits2
+        if cost2 > 0 and cost3 <= (1 - MIN_SPLIT_GAIN) * cost2 and _is_column_layout(splits3, xs, x1s):
+            splits = splits3
+
+    # Column centers (left to right) and each block's column index
+    edges = [0, *splits, n]
+    centers = [float((S[hi] - S[lo]) / (hi - lo)) for lo, hi in zip(edges, edges[1:])]
+    labels = np.searchsorted(xs[np.array(splits, dtype=np.intp) - 1], x_coords, side="left")
+
+    return {"columns": len(centers), "column_centers": centers, "labels": labels.tolist()}
@@ -0,0 +1,54 @@
+"""
+Compiled split search for the layout detector's 1-D column segmentation.
+
+numba is optional: without it ``best_splits`` is None and detect_layout uses its
+vectorised numpy search, which picks the same splits (first minimum wins in both).
+"""
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit  # type: ignore
+except ImportError:  # pragma: no cover - handled gracefully
+    njit = None  # type: ignore
+
+
+def _sse(S: np.ndarray, Q: np.ndarray, i: int, j: int) -> float:
+    d = S[j] - S[i]
+    return (Q[j] - Q[i]) - d * d / (j - i)
+
+
+def _best_splits(S: np.ndarray, Q: np.ndarray) -> Tuple[float, int, float, int, int]:
+    """
+    Exact best 2-way (xs[:s2] | xs[s2:]) and 3-way (xs[:s3] | xs[s3:t3] | xs[t3:])
+    splits of the sorted values behind the prefix sums S and Q (n >= 3).
+    Returns (cost2, s2, cost3, s3, t3).
+    """
+    n = S.shape[0] - 1
+
+    cost2, s2 = np.inf, 1
+    for s in range(1, n):
+        cost = _sse(S, Q, 0, s) + _sse(S, Q, s, n)
+        if cost < cost2:
+            cost2, s2 = cost, s
+
+    cost3, s3, t3 = np.inf, 1, 2
+    for t in range(2, n):
+        head, head_s = np.inf, 1
+        for s in range(1, t):
+            cost = _sse(S, Q, 0, s) + _sse(S, Q, s, t)
+            if cost < head:
+                head, head_s = cost, s
+        cost = head + _sse(S, Q, t, n)
+        if cost < cost3:
+            cost3, s3, t3 = cost, head_s, t
+
+    return cost2, s2, cost3, s3, t3
+
+
+best_splits = None
+if njit is not None:
+    # cache=True keeps the compiled kernel on disk, so only the first process start pays JIT cost
+    _sse = njit(cache=True, nogil=True)(_sse)
+    best_splits = njit(cache=True, nogil=True)(_best_splits)
@@ -1,39 +1,129 @@
-import fitz  # PyMuPDF
-import pdfplumber
-from pdfminer.converter import PDFPageAggregator
-from pdfminer.layout import LAParams, LTTextBox
-from pdfminer.pdfpage import PDFPage
-from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
+import asyncio
+import functools
 
+import numpy as np
+
+from . import cache as extraction_cache
+from . import pool as extraction_pool
 from .layout_detector import detect_layout
 
-def extract(file_path: str) -> list:
+# The PDF libraries are imported inside the function that uses each one, so a
+# process only pays the import cost for the backend it actually runs.
+
+
+def extract_blocks_with_pymupdf(file_path: str) -> list:
     """
-    Primary extraction function.
-    Uses pdfminer.six for detailed layout analysis (text boxes, coords)
-    as this provides the most robust data for column detection.
+    Text blocks with coordinates from PyMuPDF's get_text("blocks"), in the same
+    schema as the pdfminer text boxes. PyMuPDF measures y from the top of the page,
+    so y is flipped to pdfminer's bottom-left origin (y1 higher means higher on page).
     """
-    # You've chosen the "excellent" path. This is how you do it.
-    return extract_layout_with_pdfminer(file_path)
+    import fitz  # PyMuPDF
 
-def extract_layout_with_pdfminer(file_path: str) -> list:
+    blocks = []
+    with fitz.open(file_path) as doc:
+        for page_num, page in enumerate(doc, 1):
+            height = page.rect.height
+            blocks.extend(
+                {
+                    "text": text.strip(),
+                    "x0": x0,
+                    "y0": height - y1,
+                    "x1": x1,
+                    "y1": height - y0,
+                    "page": page_num,
+                    "type": "textbox",
+                }
+                for x0, y0, x1, y1, text, _block_no, block_type in page.get_text("blocks")
+                if block_type == 0  # text, not image
+            )
+    return blocks
+
+
+@functools.lru_cache(maxsize=1)
+def _laparams():
     """
-    Extracts layout elements (LTTextBox) with full coordinate info
-    using pdfminer.six. This gives you the granular control you asked for.
+    Layout analysis parameters, built once per process.
+    boxes_flow=None skips pdfminer's pairwise (quadratic) text-box grouping and
+    ordering pass: detect_layout clusters the boxes into columns and order_blocks
+    sorts them itself, so that work would be thrown away.
     """
-    blocks = []
-    
-    # --- This is the standard, complex setup for pdfminer.six ---
-    rsrcmgr = PDFResourceManager()
-    laparams = LAParams(
+    from pdfminer.layout import LAParams
+
+    return LAParams(
         line_margin=0.5, # Tweak these parameters for your specific resumes
         word_margin=0.1,
-        boxes_flow=0.5
+        boxes_flow=None,
+        detect_vertical=False,
+        all_texts=False,
     )
+
+
+def _pdfminer_pipeline():
+    """
+    The standard, complex setup for pdfminer.six: returns (interpreter, device).
+    A fresh resource manager per document, since its font cache is keyed by object id.
+    """
+    from pdfminer.converter import PDFPageAggregator
+    from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
+
+    rsrcmgr = PDFResourceManager()
     # Use PDFPageAggregator to get layout objects (LTTextBox, etc.)
-    device = PDFPageAggregator(rsrcmgr, laparams=laparams)
-    interpreter = PDFPageInterpreter(rsrcmgr, device)
-    
+    device = PDFPageAggregator(rsrcmgr, laparams=_laparams())
+    return PDFPageInterpreter(rsrcmgr, device), device
+
+
+def _layout_blocks(layout, page_num: int) -> list:
+    from pdfminer.layout import LTTextBox
+
+    blocks = []
+    for element in layout:
+        # We only care about text boxes, as they represent paragraphs/blocks
+        if isinstance(element, LTTextBox):
+            blocks.append({
+                "text": element.get_text().strip(),
+                "x0": element.x0,
+                "y0": element.y0,
+                "x1": element.x1,
+                "y1": element.y1,
+                "page": page_num,
+                "type": "textbox"
+                # pdfminer doesn't easily expose font info here
+                # PyMuPDF is better for that.
+            })
+    return blocks
+
+
+def order_blocks(blocks: list) -> list:
+    """
+    Assign each block its column and return the blocks in reading order.
+    """
+    layout_info = detect_layout(blocks)
+    labels = layout_info.get("labels")
+    if labels:
+        # Labels are column indexes, already numbered left to right
+        for block, label in zip(blocks, labels):
+            block["column"] = label
+
+        # Sort blocks by column (left-to-right) then top-to-bottom (y1 higher means higher on page),
+        # as one stable lexsort over coordinate arrays instead of a per-element Python key
+        x0s = np.fromiter((b["x0"] for b in blocks), dtype=np.float64, count=len(blocks))
+        y1s = np.fromiter((b["y1"] for b in blocks), dtype=np.float64, count=len(blocks))
+        order = np.lexsort((x0s, -y1s, np.asarray(labels)))
+        blocks = [blocks[i] for i in order]
+
+    return blocks
+
+
+def extract_layout_with_pdfminer(file_path: str) -> list:
+    """
+    Extracts layout elements (LTTextBox) with full coordinate info
+    using pdfminer.six. This gives you the granular control you asked for.
+    """
+    from pdfminer.pdfpage import PDFPage
+
+    blocks = []
+    interpreter, device = _pdfminer_pipeline()
+
     with open(file_path, 'rb') as fp:
         for page in PDFPage.get_pages(fp):
             try:
@@ -43,45 +133,43 @@ def extract_layout_with_pdfminer(file_path: str) -> list:
                 continue # Skip bad pages
                 
             layout = device.get_result()
-            
-            page_num = layout.pageid
-            
-            for element in layout:
-                # We only care about text boxes, as they represent paragraphs/blocks
-                if isinstance(element, LTTextBox):
-                    blocks.append({
-                        "text": element.get_text().strip(),
-                        "x0": element.x0,
-                        "y0": element.y0,
-                        "x1": element.x1,
-                        "y1": element.y1,
-                        "page": page_num,
-                        "type": "textbox"
-                        # pdfminer doesn't easily expose font info here
-                        # PyMuPDF is better for that.
-                    })
-            
-    layout_info = detect_layout(blocks)
-    labels = layout_info.get("labels")
-    if labels:
-        # Map cluster index to column order using centers
-        centers = layout_info.get("column_centers", [])
-        ordering = sorted(enumerate(centers), key=lambda item: item[1])
-        column_rank = {cluster_idx: rank for rank, (cluster_idx, _) in enumerate(ordering)}
+            blocks.extend(_layout_blocks(layout, layout.pageid))
 
-        for block, label in zip(blocks, labels):
-            block["column"] = column_rank.get(label, 0)
+    return order_blocks(blocks)
 
-        # Sort blocks by column (left-to-right) then top-to-bottom (y1 higher means higher on page)
-        blocks.sort(key=lambda b: (b.get("column", 0), -b.get("y1", 0), b.get("x0", 0)))
 
+async def extract(file_path: str) -> list:
+    """
+    Primary extraction function, run on the shared extraction process pool.
+    Uses PyMuPDF's C text-block extraction (an order of magnitude faster than
+    pdfminer) and falls back to pdfminer.six's detailed layout analysis if PyMuPDF
+    fails or finds no text. Results are cached by file content.
+    """
+    key, blocks = await asyncio.to_thread(extraction_cache.lookup, "pdf", file_path)
+    if blocks is None:
+        blocks = await _extract(file_path)
+        await asyncio.to_thread(extraction_cache.store, key, blocks)
     return blocks
 
+
+async def _extract(file_path: str) -> list:
+    try:
+        blocks = await extraction_pool.run(extract_blocks_with_pymupdf, file_path)
+    except Exception as e:
+        print(f"Warning: PyMuPDF failed, falling back to pdfminer.six: {e}")
+        blocks = []
+    if blocks:
+        return await asyncio.to_thread(order_blocks, blocks)
+    return await extraction_pool.run(extract_layout_with_pdfminer, file_path)
+
+
 def extract_with_pymupdf(file_path: str) -> list:
     """
-    Alternative/Supplementary: Extracts spans with PyMuPDF.
-    Use this if you need fast font/color metadata, or if pdfminer fails.
+    Supplementary: Extracts spans with PyMuPDF.
+    Use this if you need fast font/color metadata.
     """
+    import fitz  # PyMuPDF
+
     blocks = []
     with fitz.open(file_path) as doc:
         for page_num, page in enumerate(doc, 1):
@@ -106,6 +194,8 @@ def extract_tables_with_pdfplumber(file_path: str) -> list:
     Supplementary: Use pdfplumber *specifically* for table extraction,
     as it's the best tool for that job.
     """
+    import pdfplumber
+
     tables = []
     with pdfplumber.open(file_path) as pdf:
         for page in pdf.pages:
@@ -0,0 +1,44 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional
+
+# Lazily started so importing the app (and every worker process) stays cheap
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # Imported here, not at module level: workers import this module too and
+        # have no use for the settings.
+        from ...config import settings
+
+        _executor = ProcessPoolExecutor(
+            max_workers=max(1, min(settings.EXTRACTION_WORKERS, os.cpu_count() or 1)),
+            # Never fork the server: the child would inherit its threads, event loop,
+            # and open asyncpg / httpx connections.
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+async def run(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run a CPU-bound, picklable module-level function in the extraction process pool.
+    Unlike a worker thread this sidesteps the GIL, so several uploads parse in parallel.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), partial(func, *args))
+
+
+async def shutdown() -> None:
+    """
+    Stop the pool, waiting for workers to exit in a thread so the event loop keeps running.
+    """
+    global _executor
+    if _executor is not None:
+        executor, _executor = _executor, None
+        await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
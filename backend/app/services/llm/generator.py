@@ -1,4 +1,4 @@
-from typing import Dict, Tuple, List, Optional
+from typing import Dict, Iterator, Tuple, List, Optional
 
 from langchain_ollama import OllamaLLM
 from langchain_core.prompts import PromptTemplate
@@ -43,71 +43,71 @@ Known Weaknesses To Address:
 Output the final resume text only. Use Markdown-friendly formatting with clear section headers.
 """
 
+# Parsed once at import instead of on every request
+_GENERATION_PROMPT = PromptTemplate.from_template(GENERATION_TEMPLATE)
+
+
+# Bound once; every formatter joins its lines straight from a generator
+_join_lines = "\n".join
+
+
+def _education_line(entry: Dict) -> str:
+    get = entry.get
+    details = ", ".join(filter(None, (get("start", ""), get("end", ""), get("location", ""))))
+    parts = [f"- {get('degree', '')} at {get('school', '')}"]
+    if details:
+        parts.append(f" ({details})")
+    extra = get("notes") or get("achievements")
+    if extra:
+        parts.append(f" — {extra}")
+    return "".join(parts)
+
 
 def _format_education(education: List[Dict]) -> str:
-    lines = []
-    for entry in education:
-        degree = entry.get("degree", "")
-        school = entry.get("school", "")
-        start = entry.get("start", "")
-        end = entry.get("end", "")
-        location = entry.get("location", "")
-        details = ", ".join(filter(None, [start, end, location]))
-        line = f"- {degree} at {school}"
-        if details:
-            line += f" ({details})"
-        extra = entry.get("notes") or entry.get("achievements")
-        if extra:
-            line += f" — {extra}"
-        lines.append(line)
-    return "\n".join(lines) if lines else "N/A"
+    return _join_lines(map(_education_line, education)) or "N/A"
+
+
+def _project_line(project: Dict) -> str:
+    get = project.get
+    parts = [f"- {get('name', 'Project')}: {get('description', '')}"]
+    role = get("role")
+    if role:
+        parts.append(f" | Role: {role}")
+    technologies = get("technologies")
+    if technologies:
+        parts.append(f" | Tech: {', '.join(technologies) if isinstance(technologies, list) else technologies}")
+    impact = get("impact")
+    if impact:
+        parts.append(f" | Impact: {impact}")
+    return "".join(parts)
 
 
 def _format_projects(projects: List[Dict]) -> str:
-    lines = []
-    for project in projects:
-        name = project.get("name", "Project")
-        description = project.get("description", "")
-        role = project.get("role")
-        impact = project.get("impact")
-        technologies = project.get("technologies")
-        sentence = f"- {name}: {description}"
-        if role:
-            sentence += f" | Role: {role}"
-        if technologies:
-            sentence += f" | Tech: {', '.join(technologies)}" if isinstance(technologies, list) else f" | Tech: {technologies}"
-        if impact:
-            sentence += f" | Impact: {impact}"
-        lines.append(sentence)
-    return "\n".join(lines) if lines else "N/A"
+    return _join_lines(map(_project_line, projects)) or "N/A"
+
+
+def _experience_lines(exp: Dict) -> Iterator[str]:
+    get = exp.get
+    location = get("location", "")
+    yield (
+        f"- {get('title') or get('role', 'Role')}, {get('company', 'Company')} "
+        f"({get('start')} – {get('end') or 'Present'}{f', {location}' if location else ''})"
+    )
+    bullet_points = get("bullets") or get("summary") or get("responsibilities") or []
+    if isinstance(bullet_points, str):
+        bullet_points = [bullet_points]
+    for bullet in bullet_points:
+        yield f"  • {bullet}"
+    achievements = get("achievements")
+    if achievements:
+        if not isinstance(achievements, list):
+            achievements = [achievements]
+        for ach in achievements:
+            yield f"  • Achievement: {ach}"
 
 
 def _format_experience(experience: List[Dict]) -> str:
-    lines = []
-    for exp in experience:
-        company = exp.get("company", "Company")
-        role = exp.get("title") or exp.get("role", "Role")
-        start = exp.get("start")
-        end = exp.get("end") or "Present"
-        location = exp.get("location", "")
-        header = f"- {role}, {company} ({start} – {end}"
-        if location:
-            header += f", {location}"
-        header += ")"
-        lines.append(header)
-        bullet_points = exp.get("bullets") or exp.get("summary") or exp.get("responsibilities") or []
-        if isinstance(bullet_points, str):
-            bullet_points = [bullet_points]
-        for bullet in bullet_points:
-            lines.append(f"  • {bullet}")
-        achievements = exp.get("achievements")
-        if achievements:
-            if isinstance(achievements, list):
-                for ach in achievements:
-                    lines.append(f"  • Achievement: {ach}")
-            else:
-                lines.append(f"  • Achievement: {achievements}")
-    return "\n".join(lines) if lines else "N/A"
+    return _join_lines(line for exp in experience for line in _experience_lines(exp)) or "N/A"
 
 
 def _collapsed_list(items) -> str:
@@ -118,19 +118,17 @@ def _collapsed_list(items) -> str:
     return str(items)
 
 
+def _volunteer_line(entry: Dict) -> str:
+    get = entry.get
+    description = get("description", "")
+    line = f"- {get('role') or get('title', '')} at {get('organization', 'Organization')}"
+    return f"{line}: {description}" if description else line
+
+
 def _format_volunteer(volunteer: Optional[List[Dict]]) -> str:
     if not volunteer:
         return "N/A"
-    lines: List[str] = []
-    for entry in volunteer:
-        organization = entry.get("organization", "Organization")
-        role = entry.get("role") or entry.get("title", "")
-        description = entry.get("description", "")
-        line = f"- {role} at {organization}"
-        if description:
-            line += f": {description}"
-        lines.append(line)
-    return "\n".join(lines) if lines else "N/A"
+    return _join_lines(map(_volunteer_line, volunteer)) or "N/A"
 
 
 async def generate_resume_from_data(
@@ -143,8 +141,6 @@ async def generate_resume_from_data(
     """
     Generates an ATS-optimized resume text using candidate data plus improvement hints.
     """
-    prompt = PromptTemplate.from_template(GENERATION_TEMPLATE)
-
     payload: Dict = request.dict()
 
     payload["role"] = request.target_role or request.role
@@ -166,7 +162,7 @@ async def generate_resume_from_data(
     # Uncomment when ready for live generation
     # Example for future use when enabling LLM call:
     # from langchain.chains import LLMChain
-    # chain = LLMChain(llm=llm, prompt=prompt)
+    # chain = LLMChain(llm=llm, prompt=_GENERATION_PROMPT)
     # resume_text = await chain.arun(**payload)
 
     resume_text = (
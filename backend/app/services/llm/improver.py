@@ -25,6 +25,9 @@ Respond with:
 4. Context amplification tips (if applicable).
 """
 
+# Parsed once at import instead of on every request
+_IMPROVEMENT_PROMPT = PromptTemplate.from_template(IMPROVEMENT_TEMPLATE)
+
 
 def _extract_sections(extracted_data: Dict) -> Dict[str, str]:
     """
@@ -79,8 +82,6 @@ async def get_section_suggestions(extracted_data: dict) -> List[Dict]:
     skills = context.get("skills", "Not specified")
     target_role = context.get("target_role", "Not specified")
 
-    prompt = PromptTemplate.from_template(IMPROVEMENT_TEMPLATE)
-
     suggestions: List[Dict] = []
 
     for section_name, content in sections.items():
@@ -90,7 +91,7 @@ async def get_section_suggestions(extracted_data: dict) -> List[Dict]:
         # Real call (uncomment when ready)
         # Example for future live call using LCEL:
         # from langchain_core.output_parsers import StrOutputParser
-        # chain = prompt | llm | StrOutputParser()
+        # chain = _IMPROVEMENT_PROMPT | llm | StrOutputParser()
         # response = await chain.ainvoke({
         #     "section": section_name,
         #     "columns": columns,
@@ -1,13 +1,28 @@
 from passlib.context import CryptContext
 from datetime import datetime, timedelta
+from typing import Optional, Tuple
 from jose import jwt
 from ..config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# argon2id for new hashes; bcrypt stays verifiable for existing users and is
+# marked deprecated so it gets upgraded on their next successful login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__time_cost=2,
+    argon2__memory_cost=65536,
+)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password; also return a replacement hash if the stored one uses a
+    deprecated scheme or outdated parameters (None otherwise).
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
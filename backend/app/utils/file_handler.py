@@ -1,12 +1,40 @@
+import asyncio
+import os
+import shutil
+import sys
 from pathlib import Path
+from typing import BinaryIO
 from fastapi import UploadFile
-import aiofiles
 import uuid
 
 # Define a base upload directory (make this configurable)
 UPLOAD_DIR = Path("uploads")
 UPLOAD_DIR.mkdir(exist_ok=True)
 
+# Bytes per read/sendfile call when copying an upload to disk
+COPY_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def _copy_to_path(src: BinaryIO, dst_path: Path) -> None:
+    """
+    Blocking copy of an upload's spooled file to dst_path, from its current position.
+    Once the spool has rolled over to a real temp file, Linux copies kernel-side
+    with sendfile; small in-memory spools go through shutil.copyfileobj.
+    """
+    with open(dst_path, "wb") as dst:
+        # fileno() on an in-memory spool would force it to disk first; only use it once rolled.
+        # _rolled is a CPython implementation detail of SpooledTemporaryFile, not public API:
+        # if it is ever renamed or removed, getattr yields False and every copy takes the
+        # copyfileobj path below, which stays correct, just without sendfile.
+        if sys.platform.startswith("linux") and getattr(src, "_rolled", False):
+            src_fd, offset = src.fileno(), src.tell()
+            while sent := os.sendfile(dst.fileno(), src_fd, offset, COPY_CHUNK_SIZE):
+                offset += sent
+            src.seek(offset)
+        else:
+            shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
+
+
 async def save_upload_file(file: UploadFile, user_id: int) -> Path:
     """
     Saves an uploaded file to a user-specific directory.
@@ -23,11 +51,10 @@ async def save_upload_file(file: UploadFile, user_id: int) -> Path:
     file_path = user_dir / unique_filename
     
     try:
-        async with aiofiles.open(file_path, 'wb') as out_file:
-            while content := await file.read(1024 * 1024):  # Read in 1MB chunks
-                await out_file.write(content)
+        # One worker-thread call for the whole copy instead of an await per chunk
+        await asyncio.to_thread(_copy_to_path, file.file, file_path)
     except Exception as e:
         # Handle write error
         raise e
         
-    return file_path
\ No newline at end of file
+    return file_path
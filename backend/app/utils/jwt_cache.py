@@ -0,0 +1,53 @@
+import hashlib
+import threading
+import time
+from typing import Optional
+
+from cachetools import TTLCache
+
+# Validated tokens: sha256(token) -> (user_id, exp). Entries live at most a few
+# seconds so revoked/deleted users are picked up quickly; the token's own exp is
+# still checked on every hit.
+_valid_tokens: TTLCache = TTLCache(maxsize=10000, ttl=10)
+
+# Recently rejected tokens, cached briefly so replayed bad tokens skip the crypto.
+_rejected_tokens: TTLCache = TTLCache(maxsize=10000, ttl=1)
+
+_lock = threading.Lock()
+
+
+def token_key(token: str) -> bytes:
+    """
+    Cache key for a raw bearer token (the token itself is never stored).
+    """
+    return hashlib.sha256(token.encode()).digest()
+
+
+def get_user_id(key: bytes) -> Optional[int]:
+    """
+    Return the cached user id for a previously validated, unexpired token.
+    """
+    with _lock:
+        entry = _valid_tokens.get(key)
+    if entry is None:
+        return None
+
+    user_id, exp = entry
+    if exp is not None and exp <= time.time():
+        return None
+    return user_id
+
+
+def is_rejected(key: bytes) -> bool:
+    with _lock:
+        return key in _rejected_tokens
+
+
+def remember_valid(key: bytes, user_id: int, exp: Optional[float]) -> None:
+    with _lock:
+        _valid_tokens[key] = (user_id, exp)
+
+
+def remember_rejected(key: bytes) -> None:
+    with _lock:
+        _rejected_tokens[key] = True
@@ -0,0 +1,48 @@
+import asyncio
+
+from app import models
+from app.api.admin import profiles
+
+
+class _FakeSession:
+    def __init__(self, user):
+        self.user = user
+        self.committed = False
+
+    async def scalar(self, _statement):
+        return self.user
+
+    async def commit(self):
+        self.committed = True
+
+    async def refresh(self, _obj):
+        pass
+
+
+def test_failed_platform_keeps_snapshot_and_is_reported(monkeypatch, capsys):
+    async def fetch_github_stats(_link):
+        raise RuntimeError("rate limited")
+
+    async def get_leetcode_analytics(username):
+        return {"username": username, "solved": 42}
+
+    monkeypatch.setattr(profiles.github_api, "fetch_github_stats", fetch_github_stats)
+    monkeypatch.setattr(profiles.leetcode_analytics, "get_leetcode_analytics", get_leetcode_analytics)
+
+    user = models.user.User(
+        id=7,
+        email="jane@example.com",
+        name="Jane",
+        github_link="https://github.com/jane",
+        leetcode_link="https://leetcode.com/u/jane/",
+        github_stats={"repos": 3},
+    )
+    db = _FakeSession(user)
+
+    response = asyncio.run(profiles.fetch_profiles_endpoint(user_id=7, db=db, admin_user=None))
+
+    assert db.committed
+    assert response.github_stats == {"repos": 3}
+    assert response.leetcode_stats == {"username": "jane", "solved": 42}
+    assert response.fetch_errors == {"github_stats": "rate limited"}
+    assert "github_stats fetch failed for user 7" in capsys.readouterr().out
@@ -0,0 +1,38 @@
+import pytest
+
+from app.config import settings
+from app.services.extraction import cache as extraction_cache
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "EXTRACTION_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(extraction_cache, "_cache", None)
+    yield tmp_path / "cache"
+    if extraction_cache._cache is not None:
+        extraction_cache._cache.close()
+    extraction_cache._cache = None
+
+
+def test_lookup_misses_then_hits_under_configured_dir(cache_dir, tmp_path):
+    upload = tmp_path / "resume.pdf"
+    upload.write_bytes(b"%PDF-1.7 fake")
+
+    key, blocks = extraction_cache.lookup("pdf", str(upload))
+    assert blocks is None
+    extraction_cache.store(key, [{"text": "Experience"}])
+
+    assert extraction_cache.lookup("pdf", str(upload)) == (key, [{"text": "Experience"}])
+    assert cache_dir.is_dir()
+
+
+def test_keys_carry_cache_version_and_namespace(cache_dir, tmp_path, monkeypatch):
+    upload = tmp_path / "scan.png"
+    upload.write_bytes(b"not really a png")
+
+    key, _ = extraction_cache.lookup("image", str(upload))
+    assert key.startswith(f"v{extraction_cache.CACHE_VERSION}:image:")
+    extraction_cache.store(key, [{"text": "old schema"}])
+
+    monkeypatch.setattr(extraction_cache, "CACHE_VERSION", extraction_cache.CACHE_VERSION + 1)
+    assert extraction_cache.lookup("image", str(upload))[1] is None
@@ -0,0 +1,38 @@
+import asyncio
+import threading
+import time
+
+from app.services.extraction import image_extractor
+
+
+class _FakePaddle:
+    """Records how many ocr() calls overlap; the real predictor is not thread-safe."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def ocr(self, file_path, cls=True):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+        return [[[[[0, 0], [10, 0], [10, 5], [0, 5]], (file_path, 0.9)]]]
+
+
+def test_concurrent_extractions_never_overlap_paddle_calls(monkeypatch):
+    paddle = _FakePaddle()
+    monkeypatch.setattr(image_extractor, "_get_paddle_ocr", lambda: paddle)
+
+    async def run_all():
+        return await asyncio.gather(*(
+            asyncio.to_thread(image_extractor._paddle_blocks, f"page-{i}.png") for i in range(4)
+        ))
+
+    results = asyncio.run(run_all())
+
+    assert paddle.max_active == 1
+    assert [blocks[0]["text"] for blocks in results] == [f"page-{i}.png" for i in range(4)]
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from app.services.extraction import layout_detector
+from app.services.extraction.layout_detector import detect_layout
+
+
+def _column(x0: float, x1: float, rows: int = 8, jitter: float = 2.0) -> list:
+    rng = np.random.default_rng(int(x0))
+    return [
+        {"x0": x0 + rng.uniform(-jitter, jitter), "x1": x1 + rng.uniform(-jitter, jitter)}
+        for _ in range(rows)
+    ]
+
+
+@pytest.fixture(params=["compiled", "numpy"])
+def search(request, monkeypatch):
+    if request.param == "compiled":
+        if layout_detector.best_splits is None:
+            pytest.skip("numba not installed")
+    else:
+        monkeypatch.setattr(layout_detector, "best_splits", None)
+    return request.param
+
+
+def test_single_column(search):
+    blocks = _column(50, 550)
+    layout = detect_layout(blocks)
+    assert layout["columns"] == 1
+    assert layout["labels"] == [0] * len(blocks)
+
+
+def test_two_columns(search):
+    blocks = _column(50, 250) + _column(320, 550)
+    layout = detect_layout(blocks)
+    assert layout["columns"] == 2
+    assert layout["labels"] == [0] * 8 + [1] * 8
+    assert layout["column_centers"][0] == pytest.approx(50, abs=2)
+    assert layout["column_centers"][1] == pytest.approx(320, abs=2)
+
+
+def test_three_columns(search):
+    blocks = _column(40, 180) + _column(220, 370) + _column(410, 560)
+    layout = detect_layout(blocks)
+    assert layout["columns"] == 3
+    assert layout["labels"] == [0] * 8 + [1] * 8 + [2] * 8
+
+
+def test_indented_single_column_stays_single(search):
+    # Headings at the margin, bullets indented under them: x0 splits cleanly into
+    # two groups, but every block runs across the page, so it is one column.
+    blocks = _column(50, 550, rows=4) + _column(65, 550, rows=12)
+    layout = detect_layout(blocks)
+    assert layout["columns"] == 1
+    assert layout["labels"] == [0] * len(blocks)
+
+
+def test_too_few_blocks_is_single_column():
+    assert detect_layout([]) == {"columns": 1, "column_centers": []}
+    assert detect_layout(_column(50, 550, rows=2))["columns"] == 1
+
+
+def test_compiled_and_numpy_searches_agree(monkeypatch):
+    if layout_detector.best_splits is None:
+        pytest.skip("numba not installed")
+
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        n = int(rng.integers(3, 60))
+        centers = rng.choice([50.0, 200.0, 320.0, 420.0], size=int(rng.integers(1, 4)), replace=False)
+        x0s = rng.choice(centers, size=n) + rng.normal(0, 8, size=n)
+        widths = rng.uniform(60, 500, size=n)
+        blocks = [{"x0": float(x0), "x1": float(x0 + w)} for x0, w in zip(x0s, widths)]
+
+        compiled = detect_layout(blocks)
+        with monkeypatch.context() as m:
+            m.setattr(layout_detector, "best_splits", None)
+            fallback = detect_layout(blocks)
+
+        assert compiled["columns"] == fallback["columns"]
+        assert compiled["labels"] == fallback["labels"]
+        assert compiled["column_centers"] == pytest.approx(fallback["column_centers"])
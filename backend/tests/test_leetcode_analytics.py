@@ -0,0 +1,33 @@
+from app.services.external import leetcode_analytics
+
+NEXT_DATA_HTML = """<!DOCTYPE html>
+<html><head><title>jane - LeetCode Profile</title>
+<script src="/_next/static/chunks/main.js"></script>
+</head><body><div id="__next"></div>
+<script id="__NEXT_DATA__" type="application/json">{"props":{"pageProps":{"profileCommunity":{"profile":{"realName":"Jane Doe","userAvatar":"https://assets.leetcode.com/jane.png"}},"dehydratedState":{"queries":[{"state":{"data":{"matchedUser":{"ranking":1234,"submissionCalendar":"{\\"1704067200\\": 3, \\"1704153600\\": 2}","submitStats":{"acSubmissionNum":[{"difficulty":"All","count":10},{"difficulty":"Easy","count":6},{"difficulty":"Medium","count":3},{"difficulty":"Hard","count":1}]},"languageProblemCount":[{"languageName":"Python3","problemsSolved":9}]}}}}]}}},"page":"/[username]","query":{"username":"jane"}}</script>
+</body></html>"""
+
+
+def test_parse_next_data_reads_embedded_payload():
+    data = leetcode_analytics._parse_next_data(NEXT_DATA_HTML)
+
+    matched_user = leetcode_analytics._safe_get(data, leetcode_analytics._MATCHED_USER_PATH)
+    assert matched_user["ranking"] == 1234
+    assert leetcode_analytics._safe_get(
+        data, [*leetcode_analytics._PROFILE_COMMUNITY_PATH, "profile", "realName"]
+    ) == "Jane Doe"
+
+    heatmap = leetcode_analytics._build_heatmap(matched_user["submissionCalendar"])
+    assert heatmap["total_submissions"] == 5
+    assert heatmap["heatmap"][0] == {"date": "2024-01-01", "count": 3}
+
+    difficulties = leetcode_analytics._difficulty_breakdown(matched_user, {})
+    assert difficulties == [
+        {"difficulty": "Easy", "solved": 6},
+        {"difficulty": "Medium", "solved": 3},
+        {"difficulty": "Hard", "solved": 1},
+    ]
+
+
+def test_parse_next_data_without_payload_returns_empty():
+    assert leetcode_analytics._parse_next_data("<html><body>No data</body></html>") == {}
@@ -0,0 +1,11 @@
+def test_migrations_add_resume_columns_missing_from_baseline(run_python):
+    sql = run_python("-m", "alembic", "upgrade", "head", "--sql")
+    for column in ("tokens_cache", "ats_result", "role_match_cache"):
+        assert f"ALTER TABLE resumes ADD COLUMN IF NOT EXISTS {column} JSONB" in sql
+
+
+def test_migrations_create_the_model_indexes(run_python, resume_index_ddl):
+    sql = run_python("-m", "alembic", "upgrade", "head", "--sql")
+    for name in ("ix_resumes_combined_score", "ix_resumes_user_created"):
+        ddl = resume_index_ddl(name)
+        assert ddl.replace("CREATE INDEX", "CREATE INDEX IF NOT EXISTS") in sql
@@ -0,0 +1,26 @@
+def test_combined_score_index_parenthesises_expression(resume_index_ddl):
+    ddl = resume_index_ddl("ix_resumes_combined_score")
+    # Postgres only accepts an expression index column in its own parentheses
+    assert ddl == (
+        "CREATE INDEX ix_resumes_combined_score ON resumes "
+        "((ats_score + role_match) DESC)"
+    )
+
+
+def test_user_created_index_ddl(resume_index_ddl):
+    assert resume_index_ddl("ix_resumes_user_created") == (
+        "CREATE INDEX ix_resumes_user_created ON resumes (user_id, created_at DESC)"
+    )
+
+
+def test_mappers_configure_from_user_model_alone(run_python):
+    # Run in a fresh interpreter: within this one other tests have already
+    # imported every model, which would hide a missing import.
+    script = (
+        "import app.models.user\n"
+        "from sqlalchemy.orm import configure_mappers\n"
+        "from app.database import Base\n"
+        "configure_mappers()\n"
+        "print(sorted(Base.metadata.tables))\n"
+    )
+    assert run_python("-c", script).strip() == "['improvements', 'resumes', 'users']"
@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+from app.services.extraction import pdf_extractor
+
+
+@pytest.fixture
+def inline_extraction(monkeypatch):
+    """Run pool jobs in-process and bypass the on-disk cache."""
+
+    async def run(func, *args):
+        return func(*args)
+
+    monkeypatch.setattr(pdf_extractor.extraction_pool, "run", run)
+    monkeypatch.setattr(pdf_extractor.extraction_cache, "lookup", lambda namespace, path: ("key", None))
+    monkeypatch.setattr(pdf_extractor.extraction_cache, "store", lambda key, blocks: None)
+
+
+def _block(text, x0, y1):
+    return {"text": text, "x0": x0, "y0": y1 - 10, "x1": x0 + 100, "y1": y1, "page": 1, "type": "textbox"}
+
+
+def test_pymupdf_blocks_are_used_and_ordered(inline_extraction, monkeypatch):
+    blocks = [_block("bottom", 50, 100), _block("top", 50, 700), _block("middle", 50, 400)]
+    monkeypatch.setattr(pdf_extractor, "extract_blocks_with_pymupdf", lambda path: blocks)
+    monkeypatch.setattr(pdf_extractor, "extract_layout_with_pdfminer", lambda path: pytest.fail("no fallback"))
+
+    result = asyncio.run(pdf_extractor.extract("resume.pdf"))
+
+    assert [b["text"] for b in result] == ["top", "middle", "bottom"]
+
+
+@pytest.mark.parametrize("pymupdf_outcome", ["raises", "empty"])
+def test_falls_back_to_pdfminer(inline_extraction, monkeypatch, pymupdf_outcome):
+    def pymupdf(path):
+        if pymupdf_outcome == "raises":
+            raise RuntimeError("cannot open document")
+        return []
+
+    monkeypatch.setattr(pdf_extractor, "extract_blocks_with_pymupdf", pymupdf)
+    monkeypatch.setattr(pdf_extractor, "extract_layout_with_pdfminer", lambda path: [_block("pdfminer", 0, 10)])
+
+    result = asyncio.run(pdf_extractor.extract("resume.pdf"))
+
+    assert [b["text"] for b in result] == ["pdfminer"]